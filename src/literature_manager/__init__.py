@@ -1,3 +1,17 @@
 """Literature Manager - Automated PDF organization tool."""
 
+import logging
+import sys
+
 __version__ = "0.1.0"
+
+# Progress (e.g. Zotero sync) is reported through this package's logger.
+# Until an application configures it, the records print as plain lines on
+# stdout, as the print() calls they replaced did, so the watcher and library
+# callers keep that output. The CLI swaps this handler for a queued one; to
+# route the records elsewhere, remove it and set propagate back to True.
+_default_log_handler = logging.StreamHandler(sys.stdout)
+_logger = logging.getLogger(__name__)
+_logger.addHandler(_default_log_handler)
+_logger.setLevel(logging.INFO)
+_logger.propagate = False
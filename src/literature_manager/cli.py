@@ -4,11 +4,16 @@ import sys
 import time
 import os
 import fcntl
+import atexit
+import logging
+import logging.handlers
+import queue
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 import click
+import orjson
 from colorama import Fore, Style, init
 from slugify import slugify
 
@@ -22,6 +27,7 @@ from literature_manager.extractors.exceptions import (
 )
 from literature_manager.naming import generate_filename
 from literature_manager.operations import (
+    cached_index,
     check_duplicate,
     copy_to_recent,
     determine_destination,
@@ -45,11 +51,38 @@ from literature_manager.core import (
 init(autoreset=True)
 
 
+def _configure_logging():
+    """
+    Print the package's log records (Zotero sync progress) as plain lines.
+
+    Records are queued and written to stdout by a single listener thread,
+    so worker threads (parallel Zotero uploads) never contend on stdout or
+    interleave partial lines. Only the literature_manager logger is wired
+    up; library loggers like httpx's per-request INFO stay quiet.
+    """
+    from literature_manager import _default_log_handler
+
+    logger = logging.getLogger("literature_manager")
+    if any(isinstance(handler, logging.handlers.QueueHandler) for handler in logger.handlers):
+        return
+    logger.removeHandler(_default_log_handler)
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, logging.StreamHandler(sys.stdout))
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(logging.INFO)
+    # Keep these on stdout even when a command (watch) configures the root
+    # logger: launchd sends the watcher's stdout to watch.log
+    logger.propagate = False
+    listener.start()
+    atexit.register(listener.stop)
+
+
 @click.group()
 @click.option("--config", type=click.Path(exists=True), help="Path to config.yaml")
 @click.pass_context
 def main(ctx, config):
     """Literature Manager - Automated PDF organization tool."""
+    _configure_logging()
     try:
         ctx.ensure_object(dict)
         ctx.obj["config"] = load_config(Path(config) if config else None)
@@ -87,9 +120,17 @@ def process(ctx, dry_run, verbose):
     success_count = 0
     fail_count = 0
 
-    with click.progressbar(pdf_files, label="Processing PDFs") as bar:
-        for pdf_path in bar:
-            if process_pdf(pdf_path, config, dry_run=dry_run, verbose=verbose, notify=False):
+    # Extract the next PDFs' text in the background while the current one is
+    # waiting on CrossRef / the LLM.
+    from literature_manager.extractors.orchestrator import text_char_budget
+    from literature_manager.extractors.text_parser import prefetch_pdf_text
+
+    prefetched = prefetch_pdf_text(pdf_files, max_chars=text_char_budget(config))
+    with click.progressbar(prefetched, length=len(pdf_files), label="Processing PDFs") as bar:
+        for pdf_path, pdf_text in bar:
+            if process_pdf(
+                pdf_path, config, dry_run=dry_run, verbose=verbose, notify=False, pdf_text=pdf_text
+            ):
                 success_count += 1
             else:
                 fail_count += 1
@@ -328,8 +369,8 @@ def review_recent(ctx):
         click.echo(f"{Fore.CYAN}[{i}/{len(pdf_files)}] {pdf_path.name}{Style.RESET_ALL}")
         click.echo(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
 
-        # Load metadata from index
-        index = load_index(config.index_path)
+        # Load metadata from index (reparsed only if it changed)
+        index = cached_index(config.index_path)
         metadata = None
 
         # Find this file in index
@@ -464,8 +505,7 @@ def dedup(ctx, dry_run):
     and filesystem.
     """
     from collections import defaultdict
-    from literature_manager.operations import save_index
-    from literature_manager.utils import fuzzy_match_score
+    from literature_manager.operations import find_similar_titles, update_index_entries
 
     config = ctx.obj["config"]
     index = load_index(config.index_path)
@@ -497,6 +537,27 @@ def dedup(ctx, dry_run):
     # Find title duplicates (exact match)
     title_duplicates = [(title, entries) for title, entries in title_groups.items() if len(entries) > 1]
 
+    # Near-identical titles are only reported: fuzzy matches can be distinct
+    # papers (parts I/II, errata), so they are never deleted automatically.
+    # Pairs with two different DOIs are distinct papers and are left out.
+    similar_titles = []
+    for hash_a, hash_b, score in find_similar_titles(index):
+        doi_a = index[hash_a].get('doi', '').strip().lower()
+        doi_b = index[hash_b].get('doi', '').strip().lower()
+        if doi_a and doi_b:
+            continue
+        title_a = index[hash_a]['title'].strip().lower()
+        if title_a == index[hash_b]['title'].strip().lower() and not doi_a and not doi_b:
+            continue  # exact title match without DOIs, handled below
+        similar_titles.append((hash_a, hash_b, score))
+
+    if similar_titles:
+        click.echo(f"{Fore.YELLOW}Possible duplicates (similar titles, review manually - not removed):{Style.RESET_ALL}")
+        for hash_a, hash_b, score in similar_titles:
+            click.echo(f"  {score:4.0%}  {index[hash_a].get('filepath', '')}")
+            click.echo(f"        {index[hash_b].get('filepath', '')}")
+        click.echo()
+
     total_dups = len(doi_duplicates) + len(title_duplicates)
 
     if total_dups == 0:
@@ -508,7 +569,7 @@ def dedup(ctx, dry_run):
     if dry_run:
         print_warning("DRY RUN - No changes will be made\n")
 
-    removed_count = 0
+    removed = []
     files_deleted = 0
 
     # Process DOI duplicates
@@ -538,7 +599,7 @@ def dedup(ctx, dry_run):
                 # Remove from index
                 if hash_id in index:
                     del index[hash_id]
-                    removed_count += 1
+                    removed.append(hash_id)
 
                 # Delete file if it exists
                 full_path = config.workshop_root / filepath
@@ -574,7 +635,7 @@ def dedup(ctx, dry_run):
             if not dry_run:
                 if hash_id in index:
                     del index[hash_id]
-                    removed_count += 1
+                    removed.append(hash_id)
 
                 full_path = config.workshop_root / filepath
                 if full_path.exists():
@@ -584,9 +645,10 @@ def dedup(ctx, dry_run):
 
         click.echo()
 
-    # Save updated index
-    if not dry_run and removed_count > 0:
-        save_index(index, config.index_path)
+    # Save updated index (merged into the current one, which the watcher
+    # may have added to meanwhile)
+    if not dry_run:
+        update_index_entries(config.index_path, {}, removed)
 
     # Summary
     total_to_remove = sum(len(entries) - 1 for _, entries in doi_duplicates) + sum(len(entries) - 1 for _, entries in title_duplicates)
@@ -596,7 +658,7 @@ def dedup(ctx, dry_run):
         print_info(f"Would remove {total_to_remove} duplicate entries")
         print_info(f"Run without --dry-run to delete duplicates")
     else:
-        print_success(f"Removed {removed_count} duplicate entries from index")
+        print_success(f"Removed {len(removed)} duplicate entries from index")
         print_success(f"Deleted {files_deleted} duplicate files")
     click.echo(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}\n")
 
@@ -614,7 +676,7 @@ def enrich_summaries(ctx, limit, dry_run):
     Cost: ~$0.003 per paper (Claude Haiku)
     """
     from literature_manager.extractors.llm import generate_paper_summary
-    from literature_manager.operations import save_index
+    from literature_manager.operations import update_index_entries
 
     config = ctx.obj["config"]
     index = load_index(config.index_path)
@@ -657,6 +719,7 @@ def enrich_summaries(ctx, limit, dry_run):
 
     success_count = 0
     error_count = 0
+    changed = {}
 
     with click.progressbar(batch, label="Generating summaries") as bar:
         for hash_id, entry in bar:
@@ -670,6 +733,7 @@ def enrich_summaries(ctx, limit, dry_run):
 
                 if result.get("enhanced_summary"):
                     index[hash_id]["enhanced_summary"] = result["enhanced_summary"]
+                    changed[hash_id] = index[hash_id]
                     success_count += 1
                 else:
                     error_count += 1
@@ -678,7 +742,7 @@ def enrich_summaries(ctx, limit, dry_run):
                 error_count += 1
                 click.echo(f"\n  Error: {entry.get('title', 'Unknown')[:40]}: {e}")
 
-    save_index(index, config.index_path)
+    update_index_entries(config.index_path, changed)
 
     click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
     print_success(f"Generated summaries: {success_count} papers")
@@ -705,7 +769,7 @@ def summarize_fulltext(ctx, limit, dry_run, force):
     """
     from pathlib import Path
     from literature_manager.extractors.llm import generate_fulltext_summary
-    from literature_manager.operations import save_index
+    from literature_manager.operations import update_index_entries
 
     config = ctx.obj["config"]
     index = load_index(config.index_path)
@@ -757,6 +821,7 @@ def summarize_fulltext(ctx, limit, dry_run, force):
     success_count = 0
     error_count = 0
     processed_count = 0
+    changed = {}
 
     with click.progressbar(batch, label="Generating fulltext summaries") as bar:
         for hash_id, entry, pdf_path in bar:
@@ -770,6 +835,7 @@ def summarize_fulltext(ctx, limit, dry_run, force):
 
                 if result:
                     index[hash_id]["fulltext_summary"] = result
+                    changed[hash_id] = index[hash_id]
                     success_count += 1
                 else:
                     error_count += 1
@@ -782,9 +848,10 @@ def summarize_fulltext(ctx, limit, dry_run, force):
 
             # Save every 25 papers to avoid losing progress
             if processed_count % 25 == 0:
-                save_index(index, config.index_path)
+                update_index_entries(config.index_path, changed)
+                changed = {}
 
-    save_index(index, config.index_path)
+    update_index_entries(config.index_path, changed)
 
     click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
     print_success(f"Generated fulltext summaries: {success_count} papers")
@@ -809,7 +876,7 @@ def enrich(ctx, limit, dry_run):
     Cost: ~$0.001 per paper (Claude Haiku)
     """
     from literature_manager.extractors.llm import extract_domain_attributes
-    from literature_manager.operations import save_index
+    from literature_manager.operations import update_index_entries
 
     config = ctx.obj["config"]
     index = load_index(config.index_path)
@@ -855,6 +922,7 @@ def enrich(ctx, limit, dry_run):
     # Process batch
     success_count = 0
     error_count = 0
+    changed = {}
 
     with click.progressbar(batch, label="Enriching papers") as bar:
         for hash_id, entry in bar:
@@ -868,6 +936,7 @@ def enrich(ctx, limit, dry_run):
 
                 if result.get("domain_attributes"):
                     index[hash_id]["domain_attributes"] = result["domain_attributes"]
+                    changed[hash_id] = index[hash_id]
                     success_count += 1
                 else:
                     error_count += 1
@@ -877,7 +946,7 @@ def enrich(ctx, limit, dry_run):
                 click.echo(f"\n  Error processing {entry.get('title', 'Unknown')[:40]}: {e}")
 
     # Save updated index
-    save_index(index, config.index_path)
+    update_index_entries(config.index_path, changed)
 
     # Summary
     click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
@@ -1049,6 +1118,7 @@ def reprocess(ctx, missing_authors, missing_doi, method, hash, limit, dry_run):
     success_count = 0
     error_count = 0
     unchanged_count = 0
+    changed = {}
 
     for hash_id, entry in batch:
         old_title = entry.get("title", "Unknown")[:50]
@@ -1063,8 +1133,9 @@ def reprocess(ctx, missing_authors, missing_doi, method, hash, limit, dry_run):
             continue
 
         try:
-            # Re-extract metadata
-            new_metadata = extract_metadata(full_path, config)
+            # Re-extract metadata; LLM outputs for an unchanged title and
+            # abstract are taken from the entry instead of regenerated
+            new_metadata = extract_metadata(full_path, config, known=entry)
 
             # Check if extraction improved
             old_authors = entry.get("authors", [])
@@ -1130,7 +1201,7 @@ def reprocess(ctx, missing_authors, missing_doi, method, hash, limit, dry_run):
             if new_metadata.get("domain_attributes"):
                 entry["domain_attributes"] = new_metadata["domain_attributes"]
 
-            index[hash_id] = entry
+            changed[hash_id] = entry
             success_count += 1
 
         except Exception as e:
@@ -1138,8 +1209,8 @@ def reprocess(ctx, missing_authors, missing_doi, method, hash, limit, dry_run):
             error_count += 1
 
     # Save updated index
-    from literature_manager.operations import save_index
-    save_index(index, config.index_path)
+    from literature_manager.operations import update_index_entries
+    update_index_entries(config.index_path, changed)
 
     click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
     print_success(f"Improved: {success_count} papers")
@@ -1273,6 +1344,7 @@ def repair_from_filename(ctx, dry_run):
         return
 
     repaired = 0
+    changed = {}
     for item in to_repair:
         entry = item["entry"]
         hash_id = item["hash"]
@@ -1285,15 +1357,15 @@ def repair_from_filename(ctx, dry_run):
         if item["year"] and not entry.get("year"):
             entry["year"] = item["year"]
 
-        index[hash_id] = entry
+        changed[hash_id] = entry
         repaired += 1
 
         title = entry.get("title", "")[:40]
         print_success(f"Repaired: {item['author_str']} ({item['year']}) - {title}...")
 
     # Save index
-    from literature_manager.operations import save_index
-    save_index(index, config.index_path)
+    from literature_manager.operations import update_index_entries
+    update_index_entries(config.index_path, changed)
 
     click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
     print_success(f"Repaired {repaired} papers from filename")
@@ -1350,6 +1422,7 @@ def backfill_citations(ctx, limit, dry_run):
     success_count = 0
     skip_count = 0
     error_count = 0
+    changed = {}
 
     for hash_id, entry in batch:
         doi = entry.get("doi")
@@ -1391,7 +1464,7 @@ def backfill_citations(ctx, limit, dry_run):
                 entry["issn"] = metadata["issn"]
 
             if updated:
-                index[hash_id] = entry
+                changed[hash_id] = entry
                 success_count += 1
                 print_success(f"  {title}... ({', '.join(updates)})")
             else:
@@ -1405,8 +1478,8 @@ def backfill_citations(ctx, limit, dry_run):
             error_count += 1
 
     # Save index
-    from literature_manager.operations import save_index
-    save_index(index, config.index_path)
+    from literature_manager.operations import update_index_entries
+    update_index_entries(config.index_path, changed)
 
     click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
     print_success(f"Updated: {success_count} papers")
@@ -1432,7 +1505,6 @@ def zotero_update_citations(ctx, limit, dry_run):
     this command pushes the updated metadata from the local index to Zotero.
     Run this after backfill-citations to sync citation data to Zotero.
     """
-    import time
     from dotenv import load_dotenv
     from literature_manager.zotero_sync import ZoteroSync
 
@@ -1485,38 +1557,39 @@ def zotero_update_citations(ctx, limit, dry_run):
     no_update_needed = 0
     error_count = 0
 
-    for hash_id, entry in batch:
-        doi = entry.get("doi")
-        title = entry.get("title", "Unknown")[:40]
-
-        try:
-            result = zotero_sync.update_citation_metadata(
-                doi=doi,
-                journal=entry.get("journal"),
-                volume=entry.get("volume"),
-                issue=entry.get("issue"),
-                pages=entry.get("pages"),
-            )
-
-            if result:
-                journal = entry.get("journal", "")[:20] or "?"
-                vol = entry.get("volume", "") or "?"
-                pp = entry.get("pages", "") or "?"
-                print_success(f"  {title}... ({journal}, {vol}, {pp})")
-                success_count += 1
-            elif result is False:
-                # Item exists but no update needed
-                no_update_needed += 1
-            else:
-                # DOI not found in Zotero
-                not_in_zotero += 1
+    # Items are read and written 50 per request rather than one by one
+    updates = [
+        {
+            "doi": entry.get("doi"),
+            "journal": entry.get("journal"),
+            "volume": entry.get("volume"),
+            "issue": entry.get("issue"),
+            "pages": entry.get("pages"),
+        }
+        for _, entry in batch
+    ]
+    try:
+        results = zotero_sync.update_citation_metadata_batch(updates)
+    except Exception as e:
+        print_error(f"  Zotero update failed: {e}")
+        results = []
+        error_count = len(batch)
 
-            # Rate limit Zotero API
-            time.sleep(0.2)
+    for (hash_id, entry), result in zip(batch, results):
+        title = entry.get("title", "Unknown")[:40]
 
-        except Exception as e:
-            print_error(f"  {title}... - Error: {e}")
-            error_count += 1
+        if result:
+            journal = entry.get("journal", "")[:20] or "?"
+            vol = entry.get("volume", "") or "?"
+            pp = entry.get("pages", "") or "?"
+            print_success(f"  {title}... ({journal}, {vol}, {pp})")
+            success_count += 1
+        elif result is False:
+            # Item exists but no update needed
+            no_update_needed += 1
+        else:
+            # DOI not found in Zotero
+            not_in_zotero += 1
 
     click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
     print_success(f"Updated in Zotero: {success_count} papers")
@@ -1780,7 +1853,7 @@ def backfill_dois(ctx, limit, dry_run, upload_zotero):
         try:
             response = requests.get(url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             items = data.get("message", {}).get("items", [])
             if not items:
@@ -1837,6 +1910,8 @@ def backfill_dois(ctx, limit, dry_run, upload_zotero):
             click.echo("Zotero upload enabled\n")
         except Exception as e:
             print_warning(f"Zotero not available: {e}\n")
+    zotero_jobs = []
+    changed = {}
 
     with click.progressbar(batch, label="Searching CrossRef") as bar:
         for hash_id, entry in bar:
@@ -1850,24 +1925,19 @@ def backfill_dois(ctx, limit, dry_run, upload_zotero):
                 if doi:
                     # Update index
                     entry["doi"] = doi
-                    index[hash_id] = entry
+                    changed[hash_id] = entry
 
                     title_short = title[:40]
                     click.echo(f"\n  {Fore.GREEN}✓{Style.RESET_ALL} Found: {title_short}... → {doi}")
                     success_count += 1
 
-                    # Optional: Upload to Zotero
+                    # Optional: queue for Zotero upload after the search
                     if zot_sync:
-                        try:
-                            filepath = entry.get("filepath")
-                            if filepath:
-                                full_path = config.workshop_root / filepath
-                                if full_path.exists():
-                                    topics = entry.get("topics", [])
-                                    zot_sync.upload_paper(entry, full_path, topics)
-                                    click.echo(f"    → Uploaded to Zotero")
-                        except Exception as e:
-                            click.echo(f"    → Zotero upload failed: {e}")
+                        filepath = entry.get("filepath")
+                        if filepath:
+                            full_path = config.workshop_root / filepath
+                            if full_path.exists():
+                                zotero_jobs.append((entry, full_path, entry.get("topics", [])))
 
                 else:
                     not_found_count += 1
@@ -1878,9 +1948,16 @@ def backfill_dois(ctx, limit, dry_run, upload_zotero):
             except Exception as e:
                 error_count += 1
 
+    # Upload the papers whose DOIs were found, several at a time
+    if zotero_jobs:
+        click.echo(f"\nUploading {len(zotero_jobs)} papers to Zotero...")
+        item_keys = zot_sync.upload_papers(zotero_jobs)
+        uploaded = sum(1 for key in item_keys if key)
+        click.echo(f"  → Uploaded to Zotero: {uploaded}/{len(zotero_jobs)}")
+
     # Save index
-    from literature_manager.operations import save_index
-    save_index(index, config.index_path)
+    from literature_manager.operations import update_index_entries
+    update_index_entries(config.index_path, changed)
 
     click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
     print_success(f"Found DOIs: {success_count} papers")
@@ -2035,7 +2112,7 @@ def repair_metadata(ctx, dry_run):
     import shutil
     import requests
     import PyPDF2
-    from literature_manager.operations import save_index
+    from literature_manager.operations import update_index_entries
 
     config = ctx.obj["config"]
     index = load_index(config.index_path)
@@ -2133,7 +2210,7 @@ def repair_metadata(ctx, dry_run):
         try:
             response = requests.get(url, headers=headers, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             work = data.get("message", {})
 
@@ -2166,6 +2243,7 @@ def repair_metadata(ctx, dry_run):
     repaired_count = 0
     not_found_count = 0
     error_count = 0
+    changed = {}
 
     for hash_id, entry, reasons in to_repair:
         filepath = entry.get("filepath", "")
@@ -2249,14 +2327,14 @@ def repair_metadata(ctx, dry_run):
                 entry["filepath"] = str(new_path.relative_to(config.workshop_root))
                 click.echo(f"    Renamed to: {new_filename[:50]}...")
 
-        index[hash_id] = entry
+        changed[hash_id] = entry
         repaired_count += 1
 
         # Rate limit
         time.sleep(0.3)
 
     # Save index
-    save_index(index, config.index_path)
+    update_index_entries(config.index_path, changed)
 
     click.echo(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
     print_success(f"Repaired: {repaired_count} papers")
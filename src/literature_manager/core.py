@@ -12,6 +12,7 @@ logged — it can never take down a long-lived watcher.
 
 import os
 from pathlib import Path
+from typing import Optional
 
 import click
 from colorama import Fore, Style
@@ -30,7 +31,6 @@ from literature_manager.operations import (
     copy_to_recent,
     determine_destination,
     handle_duplicate,
-    load_index,
     log_action,
     move_and_rename_file,
     update_index,
@@ -72,25 +72,26 @@ def update_index_fulltext_summary(doi: str, fulltext_summary: dict, config) -> b
     if not doi:
         return False
 
-    from literature_manager.operations import load_index, save_index
-
-    index = load_index(config.index_path)
+    from literature_manager.operations import index_write_lock, load_index, save_index
 
     # Find entry by DOI
     doi_normalized = doi.strip().lower().replace('https://doi.org/', '').replace('http://doi.org/', '')
     updated = False
 
-    for hash_id, entry in index.items():
-        entry_doi = entry.get("doi", "")
-        if entry_doi:
-            entry_doi_normalized = entry_doi.strip().lower().replace('https://doi.org/', '').replace('http://doi.org/', '')
-            if entry_doi_normalized == doi_normalized:
-                entry["fulltext_summary"] = fulltext_summary
-                updated = True
-                break
+    with index_write_lock(config.index_path):
+        index = load_index(config.index_path)
+
+        for hash_id, entry in index.items():
+            entry_doi = entry.get("doi", "")
+            if entry_doi:
+                entry_doi_normalized = entry_doi.strip().lower().replace('https://doi.org/', '').replace('http://doi.org/', '')
+                if entry_doi_normalized == doi_normalized:
+                    entry["fulltext_summary"] = fulltext_summary
+                    updated = True
+                    break
 
-    if updated:
-        save_index(index, config.index_path)
+        if updated:
+            save_index(index, config.index_path)
 
     return updated
 
@@ -117,7 +118,13 @@ def _get_zotero_sync(config):
 
 
 def process_pdf(
-    pdf_path: Path, config, *, dry_run: bool = False, verbose: bool = True, notify: bool = False
+    pdf_path: Path,
+    config,
+    *,
+    dry_run: bool = False,
+    verbose: bool = True,
+    notify: bool = False,
+    pdf_text: Optional[str] = None,
 ) -> bool:
     """
     Process a single PDF file end to end.
@@ -131,6 +138,8 @@ def process_pdf(
         dry_run: If True, report actions without moving files or writing state.
         verbose: Verbose stdout.
         notify: If True (and not dry_run), fire a macOS notification on success.
+        pdf_text: Text already extracted from the PDF (batch prefetch); the
+            extractor reads the PDF itself when None.
     """
     from literature_manager.extractors.text_parser import is_pdf_readable
 
@@ -141,7 +150,12 @@ def process_pdf(
         ## ---------------------------------------------------------------------
         ## Check PDF readability before expensive operations
         ## ---------------------------------------------------------------------
-        is_readable, error_reason = is_pdf_readable(pdf_path)
+        if pdf_text:
+            # Prefetched text means a reader already opened the PDF, in
+            # parallel with earlier papers; no need to fork another
+            is_readable, error_reason = True, None
+        else:
+            is_readable, error_reason = is_pdf_readable(pdf_path)
 
         if not is_readable:
             print_error(f"  Corrupted or unreadable PDF: {error_reason}")
@@ -174,13 +188,12 @@ def process_pdf(
         quick_doi = extract_doi_from_pdf(pdf_path)
 
         if quick_doi:
-            # Check if this DOI already exists
-            from literature_manager.operations import check_duplicate_by_doi
-            index = load_index(config.index_path)
-            existing = check_duplicate_by_doi(quick_doi, index)
+            # Check if this DOI already exists (a dict lookup on the
+            # cached index maps; no title, so no fuzzy scan)
+            duplicate = check_duplicate({"doi": quick_doi}, config)
 
-            if existing:
-                print_warning(f"  Duplicate detected (doi): {existing}")
+            if duplicate:
+                print_warning(f"  Duplicate detected (doi): {duplicate[1]}")
                 if not dry_run and pdf_path.exists():
                     pdf_path.unlink()
                     print_info("  Duplicate deleted, skipping")
@@ -189,7 +202,7 @@ def process_pdf(
         # Extract full metadata (includes LLM enhancement)
         if verbose:
             click.echo("  Extracting metadata...")
-        metadata = extract_metadata(pdf_path, config)
+        metadata = extract_metadata(pdf_path, config, pdf_text=pdf_text)
 
         if metadata.get("extraction_confidence", 0) == 0.0:
             # Complete failure
@@ -283,6 +296,7 @@ def process_pdf(
             pdf_path,
             final_path,
             config,
+            display_name=filename,
             confidence=confidence,
             method=metadata.get("extraction_method"),
             topic=topic or "none",
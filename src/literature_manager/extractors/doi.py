@@ -5,6 +5,7 @@ import time
 from pathlib import Path
 from typing import Dict, Optional
 
+import orjson
 import PyPDF2
 import pdfplumber
 import requests
@@ -12,6 +13,9 @@ import requests
 from literature_manager.utils import extract_doi_from_text, normalize_whitespace
 from literature_manager.extractors.exceptions import CorruptedPDFError, NetworkError
 
+# JATS/HTML markup in CrossRef abstracts
+_TAG_RE = re.compile(r"<[^>]+>")
+
 
 def _retry_request(url: str, headers: dict, max_retries: int = 3, base_delay: float = 1.0):
     """
@@ -180,7 +184,7 @@ def lookup_doi_metadata(doi: str, email: Optional[str] = None) -> Optional[Dict]
         response = _retry_request(url, headers)
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             message = data.get("message", {})
 
             # Extract metadata
@@ -235,7 +239,7 @@ def lookup_doi_metadata(doi: str, email: Optional[str] = None) -> Optional[Dict]
             abstract = message.get("abstract")
             if abstract:
                 # CrossRef abstracts often have XML/HTML tags
-                abstract = re.sub(r"<[^>]+>", "", abstract)
+                abstract = _TAG_RE.sub("", abstract)
                 metadata["abstract"] = normalize_whitespace(abstract)
 
             # Keywords/subjects
@@ -1,6 +1,8 @@
 """LLM-based metadata extraction using Claude Haiku."""
 
 import json
+import time
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import anthropic
@@ -11,6 +13,90 @@ from literature_manager.utils import normalize_whitespace
 from literature_manager.extractors.exceptions import LLMError, ConfigurationError
 
 
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> Anthropic:
+    """Shared client per API key, so calls reuse its HTTP connection pool
+    instead of paying a new TLS handshake each time."""
+    return Anthropic(api_key=api_key)
+
+
+def _stream_json_text(client: Anthropic, **kwargs) -> str:
+    """
+    Stream a reply and return its text, up to the end of the first JSON object.
+
+    The connection is closed as soon as the top-level object's closing brace
+    arrives, so any trailing commentary is never waited for. Braces inside
+    JSON strings are ignored. If no object closes, the full text is returned.
+    """
+    parts = []
+    depth = 0
+    in_string = escaped = False
+    with client.messages.stream(**kwargs) as stream:
+        for chunk in stream.text_stream:
+            for i, ch in enumerate(chunk):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == "\\":
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"' and depth:
+                    in_string = True
+                elif ch == "{":
+                    depth += 1
+                elif ch == "}" and depth:
+                    depth -= 1
+                    if depth == 0:
+                        parts.append(chunk[: i + 1])
+                        return "".join(parts)
+            parts.append(chunk)
+    return "".join(parts)
+
+
+def _create_json_message(
+    client: Anthropic, model: str, max_tokens: int, prompt: str, retries: int = 2
+) -> Dict:
+    """
+    Send a prompt that asks for a JSON object and return the parsed object.
+
+    The reply is streamed and read only up to the end of the JSON object
+    (see :func:`_stream_json_text`). If it doesn't parse, the parser error is
+    sent back in the same conversation and the model is asked to fix its
+    output, up to ``retries`` times with a short backoff.
+
+    Raises:
+        ValueError: If no reply parses as a JSON object
+    """
+    messages = [{"role": "user", "content": prompt}]
+    for attempt in range(retries + 1):
+        response_text = _stream_json_text(
+            client, model=model, max_tokens=max_tokens, temperature=0, messages=messages
+        )
+        start = response_text.find("{")
+
+        try:
+            result = json.loads(response_text[start:] if start >= 0 else response_text)
+            if isinstance(result, dict):
+                return result
+            error = "expected a JSON object"
+        except json.JSONDecodeError as e:
+            error = str(e)
+
+        if attempt < retries:
+            messages = messages + [
+                {"role": "assistant", "content": response_text or "(empty)"},
+                {
+                    "role": "user",
+                    "content": f"Your previous output was not valid JSON. The parser error was: {error}. "
+                    "Return only valid JSON matching the original schema.",
+                },
+            ]
+            time.sleep(1.0 * (attempt + 1))
+
+    raise ValueError(f"Could not parse JSON from LLM response: {error}")
+
+
 EXTRACTION_PROMPT = """You are a scientific literature specialist extracting bibliographic metadata from paper text.
 
 <task>
@@ -42,22 +128,44 @@ If a field cannot be determined:
 </instructions>
 
 <output_format>
-Return ONLY valid JSON (no other text):
-{
-    "title": "...",
-    "authors": ["Last1, F.", "Last2, F.", ...],
-    "year": 2024,
-    "abstract": "...",
-    "keywords": ["keyword1", "keyword2", ...],
-    "short_title": "Finding-Focused Summary",
-    "suggested_topic": "broad-category"
-}
+Record the fields with the record_metadata tool.
 </output_format>"""
 
 
+# Tool-use schema for extract_with_llm. Forcing this tool makes the API return
+# the fields as an already-parsed dict, so there is no JSON text to repair.
+METADATA_TOOL = {
+    "name": "record_metadata",
+    "description": "Record bibliographic metadata extracted from a paper.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "title": {"type": ["string", "null"], "description": "Full paper title"},
+            "authors": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": 'Authors as "Last, F."',
+            },
+            "year": {"type": ["integer", "null"], "description": "4-digit publication year"},
+            "abstract": {"type": ["string", "null"], "description": "Full abstract text"},
+            "keywords": {"type": "array", "items": {"type": "string"}},
+            "short_title": {
+                "type": ["string", "null"],
+                "description": "4-6 word summary of the key finding",
+            },
+            "suggested_topic": {
+                "type": ["string", "null"],
+                "description": "Broad soil science category in kebab-case",
+            },
+        },
+        "required": ["title", "authors", "year"],
+    },
+}
+
+
 def extract_with_llm(
     pdf_text: str, api_key: str, model: str = "claude-haiku-4-5-20251001",
-    max_chars: int = 16000
+    max_chars: int = 16000, max_input_tokens: Optional[int] = None
 ) -> Optional[Dict]:
     """
     Extract metadata using Claude LLM.
@@ -67,13 +175,15 @@ def extract_with_llm(
         api_key: Anthropic API key
         model: Claude model to use
         max_chars: Maximum characters for LLM context (default from config)
+        max_input_tokens: Estimated token budget for the paper text; overrides
+            max_chars when set
 
     Returns:
         Metadata dict if successful, None if no text or no title found
 
     Raises:
         ConfigurationError: If API key is missing
-        LLMError: If API call fails or returns invalid JSON
+        LLMError: If API call fails or returns no metadata
     """
     if not api_key:
         raise ConfigurationError(
@@ -86,44 +196,35 @@ def extract_with_llm(
 
     try:
         # Truncate text to fit within token limits
-        truncated_text = truncate_text_for_llm(pdf_text, max_chars=max_chars)
+        truncated_text = truncate_text_for_llm(
+            pdf_text, max_chars=max_chars, max_tokens=max_input_tokens
+        )
 
         # Create prompt
         prompt = EXTRACTION_PROMPT.replace("%TEXT%", truncated_text)
 
         # Call Claude API
-        client = Anthropic(api_key=api_key)
+        client = _get_client(api_key)
 
         message = client.messages.create(
-            model=model, max_tokens=2000, temperature=0, messages=[{"role": "user", "content": prompt}]
+            model=model,
+            max_tokens=2000,
+            temperature=0,
+            tools=[METADATA_TOOL],
+            tool_choice={"type": "tool", "name": METADATA_TOOL["name"]},
+            messages=[{"role": "user", "content": prompt}],
         )
 
-        # Extract response
-        response_text = message.content[0].text
-
-        # Parse JSON response
-        try:
-            metadata = json.loads(response_text)
-        except json.JSONDecodeError:
-            # Try to extract JSON from response if surrounded by other text
-            import re
-
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                try:
-                    metadata = json.loads(json_match.group(0))
-                except json.JSONDecodeError:
-                    raise LLMError(
-                        "LLM returned invalid JSON",
-                        api_error=response_text[:200],
-                        method="llm_parsing"
-                    )
-            else:
-                raise LLMError(
-                    "LLM returned invalid JSON",
-                    api_error=response_text[:200],
-                    method="llm_parsing"
-                )
+        # The forced tool call carries the fields as a parsed dict
+        metadata = next(
+            (block.input for block in message.content if block.type == "tool_use"), None
+        )
+        if not isinstance(metadata, dict):
+            raise LLMError(
+                "LLM returned no metadata tool call",
+                api_error=str(message.stop_reason),
+                method="llm_parsing"
+            )
 
         # Validate and normalize
         result = {
@@ -353,16 +454,17 @@ def enhance_metadata_with_llm(
         metadata: Metadata dict with at minimum 'title', optionally 'abstract' and 'keywords'
         api_key: Anthropic API key
         model: Claude model to use
-        retry: Whether to retry once on failure
+        retry: Whether to retry once if the API call fails (replies that
+            don't parse are already repaired by _create_json_message)
         existing_topics: Ignored (kept for backwards compatibility)
 
     Returns:
         Enhanced metadata dict with 'summary' and 'suggested_topic' fields added
     """
-    from literature_manager.taxonomy import TopicTaxonomy
+    from literature_manager.taxonomy import load_taxonomy
 
-    # Load taxonomy
-    taxonomy = TopicTaxonomy()
+    # Load taxonomy (parsed once per batch unless topics.yml changes)
+    taxonomy = load_taxonomy()
 
     # Build prompt
     title = metadata.get("title", "")
@@ -393,27 +495,9 @@ def enhance_metadata_with_llm(
 
     try:
         # Call Claude API
-        client = Anthropic(api_key=api_key)
+        client = _get_client(api_key)
 
-        message = client.messages.create(
-            model=model, max_tokens=200, temperature=0, messages=[{"role": "user", "content": prompt}]
-        )
-
-        # Extract response
-        response_text = message.content[0].text
-
-        # Parse JSON response
-        try:
-            result = json.loads(response_text)
-        except json.JSONDecodeError:
-            # Try to extract JSON from response
-            import re
-
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group(0))
-            else:
-                raise ValueError("Could not parse JSON from LLM response")
+        result = _create_json_message(client, model, 200, prompt)
 
         # Validate response
         summary = result.get("summary", "")
@@ -459,10 +543,14 @@ def enhance_metadata_with_llm(
     except Exception as e:
         print(f"LLM enhancement error: {e}")
 
-        # Retry once if requested
-        if retry:
+        # Retry once if requested. A ValueError means no reply parsed after
+        # the in-conversation repairs, and sending the prompt again would
+        # only repeat them
+        if retry and not isinstance(e, ValueError):
             print("Retrying LLM enhancement...")
-            return enhance_metadata_with_llm(metadata, api_key, model, retry=False)
+            return enhance_metadata_with_llm(
+                metadata, api_key, model, retry=False, existing_topics=existing_topics
+            )
 
         # Fallback: return metadata unchanged
         return metadata
@@ -525,28 +613,9 @@ def generate_paper_summary(
     prompt = prompt.replace("%ABSTRACT%", abstract)
 
     try:
-        client = Anthropic(api_key=api_key)
-
-        message = client.messages.create(
-            model=model,
-            max_tokens=600,
-            temperature=0,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        client = _get_client(api_key)
 
-        response_text = message.content[0].text
-
-        # Parse JSON response
-        try:
-            summary_data = json.loads(response_text)
-        except json.JSONDecodeError:
-            import re
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                summary_data = json.loads(json_match.group(0))
-            else:
-                print(f"Warning: Could not parse summary JSON")
-                return metadata
+        summary_data = _create_json_message(client, model, 600, prompt)
 
         # Add to metadata
         metadata["enhanced_summary"] = {
@@ -642,27 +711,9 @@ def generate_fulltext_summary(
     prompt = prompt.replace("%FULLTEXT%", full_text)
 
     try:
-        client = Anthropic(api_key=api_key)
+        client = _get_client(api_key)
 
-        message = client.messages.create(
-            model=model,
-            max_tokens=800,
-            temperature=0,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        response_text = message.content[0].text
-
-        # Parse JSON response
-        try:
-            summary_data = json.loads(response_text)
-        except json.JSONDecodeError:
-            import re
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                summary_data = json.loads(json_match.group(0))
-            else:
-                return None
+        summary_data = _create_json_message(client, model, 800, prompt)
 
         return {
             "main_finding": summary_data.get("main_finding", ""),
@@ -787,28 +838,9 @@ def extract_domain_attributes(
     prompt = prompt.replace("%ABSTRACT%", abstract)
 
     try:
-        client = Anthropic(api_key=api_key)
+        client = _get_client(api_key)
 
-        message = client.messages.create(
-            model=model,
-            max_tokens=500,
-            temperature=0,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        response_text = message.content[0].text
-
-        # Parse JSON response
-        try:
-            domain_attrs = json.loads(response_text)
-        except json.JSONDecodeError:
-            import re
-            json_match = re.search(r"\{.*\}", response_text, re.DOTALL)
-            if json_match:
-                domain_attrs = json.loads(json_match.group(0))
-            else:
-                print(f"Warning: Could not parse domain attributes JSON")
-                return metadata
+        domain_attrs = _create_json_message(client, model, 500, prompt)
 
         # Add to metadata
         metadata["domain_attributes"] = {
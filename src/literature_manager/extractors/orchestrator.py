@@ -1,7 +1,7 @@
 """Metadata extraction orchestrator - tries multiple methods in priority order."""
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 from literature_manager.config import Config
 from literature_manager.extractors.doi import extract_with_doi
@@ -16,7 +16,25 @@ from literature_manager.extractors.exceptions import (
 )
 
 
-def extract_metadata(pdf_path: Path, config: Config) -> Dict:
+def text_char_budget(config: Config) -> Optional[int]:
+    """
+    Characters of PDF text worth reading for the LLM.
+
+    Text past ``llm_max_chars`` is truncated before it reaches the model, so
+    readers can stop there. With a token budget (``llm_max_input_tokens``)
+    there is no fixed character bound, so everything is read.
+    """
+    if config.get("llm_max_input_tokens"):
+        return None
+    return config.get("llm_max_chars", 16000)
+
+
+def extract_metadata(
+    pdf_path: Path,
+    config: Config,
+    pdf_text: Optional[str] = None,
+    known: Optional[Dict] = None,
+) -> Dict:
     """
     Extract metadata from PDF using multiple methods in priority order.
 
@@ -32,6 +50,12 @@ def extract_metadata(pdf_path: Path, config: Config) -> Dict:
     Args:
         pdf_path: Path to PDF file
         config: Configuration object
+        pdf_text: Text already extracted from the PDF (e.g. prefetched by a
+            batch run); extracted on demand when None
+        known: Fields already stored for this paper (its index entry when
+            reprocessing). Its summary, topics, domain attributes and
+            enhanced summary are reused, skipping the LLM calls that would
+            regenerate them, if the title and abstract are unchanged
 
     Returns:
         Metadata dict with extracted information
@@ -42,6 +66,12 @@ def extract_metadata(pdf_path: Path, config: Config) -> Dict:
     """
     preferred_methods = config.get("preferred_methods", ["doi_lookup", "pdf_metadata", "llm_parsing"])
 
+    def get_pdf_text() -> Optional[str]:
+        nonlocal pdf_text
+        if pdf_text is None:
+            pdf_text = extract_text_from_pdf(pdf_path, max_chars=text_char_budget(config))
+        return pdf_text
+
     metadata = None
     errors_encountered = []  # Track what went wrong for logging
 
@@ -67,12 +97,14 @@ def extract_metadata(pdf_path: Path, config: Config) -> Dict:
             elif method == "llm_parsing":
                 # Try LLM extraction
                 # First extract text
-                pdf_text = extract_text_from_pdf(pdf_path)
-                if pdf_text:
+                if get_pdf_text():
                     api_key = config.get("anthropic_api_key")
                     model = config.get("llm_model", "claude-haiku-4-5-20251001")
                     max_chars = config.get("llm_max_chars", 16000)
-                    metadata = extract_with_llm(pdf_text, api_key, model, max_chars)
+                    max_input_tokens = config.get("llm_max_input_tokens")
+                    metadata = extract_with_llm(
+                        pdf_text, api_key, model, max_chars, max_input_tokens
+                    )
                     if metadata:
                         break
                     else:
@@ -110,13 +142,15 @@ def extract_metadata(pdf_path: Path, config: Config) -> Dict:
         # SUCCESS! Now check if we need to extract abstract from PDF text
         # If DOI/PDF metadata succeeded but didn't get abstract, fallback to LLM text extraction
         if not metadata.get("abstract"):
-            pdf_text = extract_text_from_pdf(pdf_path)
-            if pdf_text:
+            if get_pdf_text():
                 api_key = config.get("anthropic_api_key")
                 model = config.get("llm_model", "claude-haiku-4-5-20251001")
                 max_chars = config.get("llm_max_chars", 16000)
+                max_input_tokens = config.get("llm_max_input_tokens")
                 # Use LLM to extract just the abstract from PDF text
-                llm_metadata = extract_with_llm(pdf_text, api_key, model, max_chars)
+                llm_metadata = extract_with_llm(
+                    pdf_text, api_key, model, max_chars, max_input_tokens
+                )
                 if llm_metadata and llm_metadata.get("abstract"):
                     # Keep the good metadata (title, authors, year from DOI) but add the abstract
                     metadata["abstract"] = llm_metadata["abstract"]
@@ -128,22 +162,37 @@ def extract_metadata(pdf_path: Path, config: Config) -> Dict:
         api_key = config.get("anthropic_api_key")
         model = config.get("llm_model", "claude-haiku-4-5-20251001")
 
-        if api_key:
-            # Get existing topics from by-topic/ directory
-            existing_topics = []
-            by_topic_path = config.by_topic_path
-            if by_topic_path.exists():
-                existing_topics = [d.name for d in by_topic_path.iterdir() if d.is_dir() and not d.name.startswith('.')]
+        # These calls only read the title and abstract, so while those match
+        # the known entry its generated fields stand in for the calls
+        reuse = {}
+        if known and all(
+            (known.get(field) or "") == (metadata.get(field) or "")
+            for field in ("title", "abstract")
+        ):
+            reuse = known
 
-            metadata = enhance_metadata_with_llm(metadata, api_key, model, existing_topics=existing_topics)
+        if api_key:
+            # Topics come from the fixed taxonomy (topics.yml), not from the
+            # by-topic/ folders, so there is no directory scan to do here.
+            if reuse.get("summary") and reuse.get("topics"):
+                metadata["summary"] = reuse["summary"]
+                metadata["suggested_topic"] = "|".join(reuse["topics"])
+            else:
+                metadata = enhance_metadata_with_llm(metadata, api_key, model)
 
             # Extract domain-specific attributes (study type, methods, fractions, etc.)
             if config.get("extract_domain_attributes", True):
-                metadata = extract_domain_attributes(metadata, api_key, model)
+                if reuse.get("domain_attributes"):
+                    metadata["domain_attributes"] = reuse["domain_attributes"]
+                else:
+                    metadata = extract_domain_attributes(metadata, api_key, model)
 
             # Generate enhanced paper summary for Zotero notes
             if config.get("generate_paper_summary", True):
-                metadata = generate_paper_summary(metadata, api_key, model)
+                if reuse.get("enhanced_summary"):
+                    metadata["enhanced_summary"] = reuse["enhanced_summary"]
+                else:
+                    metadata = generate_paper_summary(metadata, api_key, model)
 
     # Add original filename
     metadata["original_filename"] = pdf_path.name
@@ -0,0 +1,94 @@
+"""Strip publisher boilerplate from extracted PDF text.
+
+Page headers/footers, "Downloaded from ..." stamps, copyright lines and page
+counters repeat on every page and carry nothing the LLM needs, yet they eat
+into the truncated text window. :func:`clean_boilerplate` removes them before
+whitespace is normalized, while page and line breaks are still intact.
+"""
+
+import re
+from typing import List, Optional
+
+# Pages are separated by form feeds (the readers in text_parser and
+# pdftotext both emit them).
+PAGE_BREAK = "\f"
+
+# Noise matched anywhere in a line; a line left empty afterwards is dropped.
+# DOI links go too: the DOI module reads them from the PDF itself.
+_BOILERPLATE_RES = (
+    re.compile(r"Downloaded from .+? by .+? on \d+.*", re.IGNORECASE),
+    re.compile(r"(?:©|\(c\)|Copyright)\s*\d{4}\s+(?:Elsevier|Springer|Wiley)\b.*", re.IGNORECASE),
+    re.compile(r"\bPage \d+ of \d+\b", re.IGNORECASE),
+    re.compile(r"https?://(?:dx\.)?doi\.org/\S+", re.IGNORECASE),
+)
+
+# A page number leading or trailing a header line
+_PAGE_NUMBER_RE = re.compile(r"^\d+\s+|\s+\d+$")
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# Running headers are looked for on this many leading pages
+_HEADER_SCAN_PAGES = 3
+
+# Lines with fewer letters (table rows, bare numbers, equations) are content
+# that may legitimately repeat, never a running header
+_HEADER_MIN_LETTERS = 8
+
+
+def _line_key(line: str) -> Optional[str]:
+    """Comparison key for running-header detection, or None if the line can't
+    be a header. Only a leading/trailing page number is dropped, so "Soil
+    Biol. 12 (2024) 101" and "... 102" match but other numbers still count."""
+    line = line.strip().lower()
+    if len(_LETTER_RE.findall(line)) < _HEADER_MIN_LETTERS:
+        return None
+    return _PAGE_NUMBER_RE.sub("", line)
+
+
+def _running_headers(pages: List[List[str]]) -> set:
+    """Line keys that repeat on at least two of the first few pages."""
+    seen = {}
+    for lines in pages[:_HEADER_SCAN_PAGES]:
+        for key in {_line_key(line) for line in lines} - {None}:
+            seen[key] = seen.get(key, 0) + 1
+    return {key for key, count in seen.items() if count >= 2}
+
+
+def clean_boilerplate(text: str) -> str:
+    """
+    Remove boilerplate lines from page-separated PDF text.
+
+    Drops known publisher noise (download stamps, copyright lines, "Page N of
+    M", doi.org links), repeats of running headers/footers, and consecutive
+    duplicate lines. The first occurrence of a running header is kept, so a
+    title that doubles as the page header survives on page one.
+
+    Args:
+        text: Extracted text, pages separated by form feeds
+
+    Returns:
+        Cleaned text with the same page separators
+    """
+    pages = [page.split("\n") for page in text.split(PAGE_BREAK)]
+    headers = _running_headers(pages) if len(pages) > 1 else set()
+
+    emitted = set()
+    cleaned_pages = []
+    previous = None
+    for lines in pages:
+        kept = []
+        for line in lines:
+            for pattern in _BOILERPLATE_RES:
+                line = pattern.sub("", line)
+            line = line.strip()
+            if not line or line == previous:
+                continue
+            key = _line_key(line)
+            if key in headers:
+                if key in emitted:
+                    continue
+                emitted.add(key)
+            kept.append(line)
+            previous = line
+        cleaned_pages.append("\n".join(kept))
+
+    return PAGE_BREAK.join(cleaned_pages)
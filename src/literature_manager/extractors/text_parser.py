@@ -3,59 +3,123 @@
 Reading is done through a fallback chain of independent readers
 (:func:`_read_pdf_text`). Two hardening measures live here:
 
-1. **Fallback chain.** pdfminer (via pdfplumber) is non-deterministic on some
-   valid PDFs — it throws on files poppler/pypdfium2 read fine. It used to be the
-   sole reader, so any pdfminer hiccup terminally quarantined the file to
-   ``corrupted/``. We now fall back to pypdfium2 then poppler ``pdftotext`` and
-   only declare a file unreadable when *no* reader can open it.
+1. **Fallback chain.** pypdfium2 (PDFium, C++) reads first: it is several
+   times faster than pdfminer's pure-Python interpreter behind pdfplumber.
+   pdfminer is also non-deterministic on some valid PDFs — it throws on files
+   poppler/pypdfium2 read fine — and used to be the sole reader, so any pdfminer
+   hiccup terminally quarantined the file to ``corrupted/``. pdfplumber and then
+   poppler ``pdftotext`` are fallbacks, and a file is only declared unreadable
+   when *no* reader can open it.
 
 2. **Subprocess isolation.** The in-process readers wrap C libraries
    (pdfminer's native bits, PDFium) that can *segfault* on malformed input — a
    SIGSEGV that no ``try/except`` can catch and that kills the whole watcher
    process (observed 2026-07-22: status=11/SEGV core-dump on a PDF read). Each
-   in-process read therefore runs in a forked child; if the child dies from a
+   in-process read therefore runs in a child process; if the child dies from a
    signal or times out, the parent treats that reader as failed and falls
    through. ``pdftotext`` is already a subprocess, so it needs no wrapper.
 """
 
 import multiprocessing
+import os
+import re
+import signal
 import subprocess
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 
 from literature_manager.utils import normalize_whitespace
+from literature_manager.extractors.text_cleaner import PAGE_BREAK, clean_boilerplate
 from literature_manager.extractors.exceptions import CorruptedPDFError
 
+# Token-sized pieces for the local token estimate: word runs and single
+# punctuation marks. Long words cost roughly one token per 4 characters.
+_TOKEN_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+
 _PDFTOTEXT_BIN = "/usr/bin/pdftotext"
 _PDFTOTEXT_TIMEOUT = 30  # seconds, per file
 _READER_TIMEOUT = 60  # seconds for an isolated in-process reader child
-
-# A dedicated fork context: fork is cheap and the workers touch no shared state
-# that a fork would corrupt (they open the file fresh and return via a queue).
-_MP = multiprocessing.get_context("fork")
+# Seconds for one page inside a reader child. Pathological pages (multi-MB
+# content streams that yield a few hundred characters) are skipped instead of
+# eating the whole reader timeout. Only interrupts Python code (pdfminer);
+# PDFium's C calls are still bounded by _READER_TIMEOUT.
+_PAGE_TIMEOUT = 5.0
+
+# Extracted text keyed on file identity, so a PDF read during extraction is
+# not parsed again after core has renamed/moved it (rename keeps inode+mtime).
+_TEXT_CACHE_SIZE = 128
+# Values are (text, max_chars): max_chars is None when the read was not cut
+# short, so the entry also serves callers that want the full pages.
+_text_cache: "OrderedDict[tuple, Tuple[Optional[str], Optional[int]]]" = OrderedDict()
+_text_cache_lock = threading.Lock()  # prefetch fills it from worker threads
+
+# Reader children are forked by a forkserver, not by us: prefetch starts reads
+# from worker threads while other threads hold locks (imports, logging, the
+# text cache, ssl), and a child forked mid-hold would inherit them locked. The
+# single-threaded server holds none, and preloads this module and the readers
+# so children still start without importing them.
+_MP = multiprocessing.get_context("forkserver")
+_MP.set_forkserver_preload([__name__, "pypdfium2", "pdfplumber"])
 
 
 # --- in-process reader bodies (run INSIDE the isolation subprocess) -----------
+#
+# Bodies stop after the page that brings the text to ``max_chars`` (None: read
+# every page up to max_pages); whatever comes after would be truncated anyway.
+
+class _PageTimeout(Exception):
+    pass
+
+
+def _raise_page_timeout(signum, frame):
+    raise _PageTimeout()
+
+
+@contextmanager
+def _page_deadline(seconds: float):
+    """Raise _PageTimeout if the block runs longer than ``seconds``. Uses
+    SIGALRM, which is fine here: bodies run on the main thread of their own
+    child process."""
+    previous = signal.signal(signal.SIGALRM, _raise_page_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
 
-def _pdfplumber_body(pdf_path: str, max_pages: int):
+
+def _pdfplumber_body(pdf_path: str, max_pages: int, max_chars: Optional[int]):
     import pdfplumber
 
-    with pdfplumber.open(pdf_path) as pdf:
+    # Only wrap the pages we read. Without ``pages=`` pdfplumber builds a Page
+    # object for every page in the file, so a 200-page review paid for all of
+    # them to yield three pages of text. Page numbers here are 1-based.
+    with pdfplumber.open(pdf_path, pages=list(range(1, max_pages + 1))) as pdf:
         n = len(pdf.pages)
         if n == 0:
             return False, None
         parts = []
-        for i in range(min(max_pages, n)):
+        total = 0
+        for i in range(n):
             try:
-                t = pdf.pages[i].extract_text()
-            except Exception:
+                with _page_deadline(_PAGE_TIMEOUT):
+                    t = pdf.pages[i].extract_text()
+            except Exception:  # includes _PageTimeout: treat the page as empty
                 t = None
             if t:
                 parts.append(t)
-        return True, (" ".join(parts) if parts else None)
+                total += len(t)
+                if max_chars is not None and total >= max_chars:
+                    break
+        return True, (PAGE_BREAK.join(parts) if parts else None)
 
 
-def _pypdfium2_body(pdf_path: str, max_pages: int):
+def _pypdfium2_body(pdf_path: str, max_pages: int, max_chars: Optional[int]):
     import pypdfium2 as pdfium
 
     doc = pdfium.PdfDocument(pdf_path)
@@ -64,35 +128,58 @@ def _pypdfium2_body(pdf_path: str, max_pages: int):
         if n == 0:
             return False, None
         parts = []
+        total = 0
         for i in range(min(max_pages, n)):
-            page = doc[i]
-            textpage = page.get_textpage()
-            t = textpage.get_text_range()
-            textpage.close()
-            page.close()
+            try:
+                with _page_deadline(_PAGE_TIMEOUT):
+                    page = doc[i]
+                    textpage = page.get_textpage()
+                    t = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+            except _PageTimeout:
+                t = None
             if t and t.strip():
                 parts.append(t)
-        return True, (" ".join(parts) if parts else None)
+                total += len(t)
+                if max_chars is not None and total >= max_chars:
+                    break
+        return True, (PAGE_BREAK.join(parts) if parts else None)
     finally:
         doc.close()
 
 
-def _isolation_worker(body, pdf_path: str, max_pages: int, queue) -> None:
-    """Run a reader body and push its result. Runs in a forked child so a
+def _pypdfium2_open_body(pdf_path: str, max_pages: int, max_chars: Optional[int]):
+    """Open the document and count pages only — no page or text objects."""
+    import pypdfium2 as pdfium
+
+    doc = pdfium.PdfDocument(pdf_path)
+    try:
+        return len(doc) > 0, None
+    finally:
+        doc.close()
+
+
+def _isolation_worker(
+    body, pdf_path: str, max_pages: int, max_chars: Optional[int], queue
+) -> None:
+    """Run a reader body and push its result. Runs in a child process so a
     native segfault here dies with the child, not the parent."""
     try:
-        queue.put(body(pdf_path, max_pages))
+        queue.put(body(pdf_path, max_pages, max_chars))
     except Exception:
         queue.put((False, None))
 
 
-def _run_isolated(body, pdf_path: Path, max_pages: int) -> tuple[bool, Optional[str]]:
-    """Run an in-process reader body in a forked child. If the child segfaults,
+def _run_isolated(
+    body, pdf_path: Path, max_pages: int, max_chars: Optional[int]
+) -> tuple[bool, Optional[str]]:
+    """Run an in-process reader body in a child process. If the child segfaults,
     is killed, times out, or errors, return (False, None) so the caller falls
     through to the next reader. The parent process is never taken down."""
     queue = _MP.Queue()
     proc = _MP.Process(
-        target=_isolation_worker, args=(body, str(pdf_path), max_pages, queue)
+        target=_isolation_worker, args=(body, str(pdf_path), max_pages, max_chars, queue)
     )
     proc.start()
     proc.join(_READER_TIMEOUT)
@@ -118,16 +205,23 @@ def _run_isolated(body, pdf_path: Path, max_pages: int) -> tuple[bool, Optional[
 
 # --- reader adapters (each never raises) --------------------------------------
 
-def _try_pdfplumber(pdf_path: Path, max_pages: int) -> tuple[bool, Optional[str]]:
-    return _run_isolated(_pdfplumber_body, pdf_path, max_pages)
+def _try_pdfplumber(
+    pdf_path: Path, max_pages: int, max_chars: Optional[int]
+) -> tuple[bool, Optional[str]]:
+    return _run_isolated(_pdfplumber_body, pdf_path, max_pages, max_chars)
 
 
-def _try_pypdfium2(pdf_path: Path, max_pages: int) -> tuple[bool, Optional[str]]:
-    return _run_isolated(_pypdfium2_body, pdf_path, max_pages)
+def _try_pypdfium2(
+    pdf_path: Path, max_pages: int, max_chars: Optional[int]
+) -> tuple[bool, Optional[str]]:
+    return _run_isolated(_pypdfium2_body, pdf_path, max_pages, max_chars)
 
 
-def _try_pdftotext(pdf_path: Path, max_pages: int) -> tuple[bool, Optional[str]]:
-    """poppler ``pdftotext`` — already its own process, so no fork wrapper."""
+def _try_pdftotext(
+    pdf_path: Path, max_pages: int, max_chars: Optional[int]
+) -> tuple[bool, Optional[str]]:
+    """poppler ``pdftotext`` — already its own process, so no isolation wrapper.
+    It has no per-page hook, so ``max_chars`` is not used for an early exit."""
     try:
         result = subprocess.run(
             [_PDFTOTEXT_BIN, "-l", str(max_pages), str(pdf_path), "-"],
@@ -142,16 +236,18 @@ def _try_pdftotext(pdf_path: Path, max_pages: int) -> tuple[bool, Optional[str]]
         return False, None
 
 
-_READERS = (_try_pdfplumber, _try_pypdfium2, _try_pdftotext)
+_READERS = (_try_pypdfium2, _try_pdfplumber, _try_pdftotext)
 
 
-def _read_pdf_text(pdf_path: Path, max_pages: int = 3) -> tuple[bool, Optional[str]]:
+def _read_pdf_text(
+    pdf_path: Path, max_pages: int = 3, max_chars: Optional[int] = None
+) -> tuple[bool, Optional[str]]:
     """Try every available reader until one opens the PDF.
 
-    Readers are tried in order (pdfplumber, pypdfium2, pdftotext) so normal files
-    keep pdfplumber's layout-aware text; the fallbacks only run when an earlier
-    reader fails. The in-process readers run in forked children so a native
-    segfault cannot take down the caller.
+    Readers are tried in order (pypdfium2, pdfplumber, pdftotext); the fallbacks
+    only run when an earlier reader fails. The in-process readers run in child processes so a native
+    segfault cannot take down the caller. With ``max_chars`` set, readers stop
+    after the page that reaches that many characters.
 
     Returns (opened, text):
       - opened=True  -> at least one reader opened the file (>=1 page). ``text``
@@ -163,7 +259,7 @@ def _read_pdf_text(pdf_path: Path, max_pages: int = 3) -> tuple[bool, Optional[s
     """
     opened_anywhere = False
     for reader in _READERS:
-        opened, text = reader(pdf_path, max_pages)
+        opened, text = reader(pdf_path, max_pages, max_chars)
         if opened:
             opened_anywhere = True
             if text:
@@ -174,13 +270,20 @@ def _read_pdf_text(pdf_path: Path, max_pages: int = 3) -> tuple[bool, Optional[s
     return False, None
 
 
-def extract_text_from_pdf(pdf_path: Path, max_pages: int = 3) -> Optional[str]:
+def extract_text_from_pdf(
+    pdf_path: Path, max_pages: int = 3, max_chars: Optional[int] = None
+) -> Optional[str]:
     """
     Extract text from PDF file.
 
     Args:
         pdf_path: Path to PDF file
         max_pages: Maximum number of pages to extract (default: 3)
+        max_chars: Stop reading pages once this many characters are collected
+            (e.g. the LLM input budget); None reads all ``max_pages`` pages
+
+    Results are cached by file identity (device, inode, size, mtime), so
+    reading the same file again — including after a rename — is free.
 
     Returns:
         Extracted text as string, or None if no text found (scanned images)
@@ -188,32 +291,142 @@ def extract_text_from_pdf(pdf_path: Path, max_pages: int = 3) -> Optional[str]:
     Raises:
         CorruptedPDFError: If no reader can open the PDF
     """
-    opened, text = _read_pdf_text(pdf_path, max_pages)
+    try:
+        st = os.stat(pdf_path)
+        key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, max_pages)
+    except OSError:
+        key = None  # let the readers report it as unreadable
+    with _text_cache_lock:
+        if key in _text_cache:
+            cached_text, cut_at = _text_cache[key]
+            # A read cut short at N chars only serves callers asking for <= N
+            if cut_at is None or (max_chars is not None and max_chars <= cut_at):
+                _text_cache.move_to_end(key)
+                return cached_text
+
+    opened, text = _read_pdf_text(pdf_path, max_pages, max_chars)
     if not opened:
         raise CorruptedPDFError(
-            "All PDF readers failed (pdfplumber, pypdfium2, pdftotext)",
+            "All PDF readers failed (pypdfium2, pdfplumber, pdftotext)",
             pdf_path=pdf_path,
             method="text_extraction",
         )
-    if text is None:
-        # Opened but no text - might be scanned images (not an error)
-        return None
-    return normalize_whitespace(text)
+    # Readers only stop early once the raw text reaches max_chars
+    cut_at = None
+    if text is not None and max_chars is not None and len(text) >= max_chars:
+        cut_at = max_chars
+    if text is not None:
+        # Strip headers/footers while page and line breaks still exist
+        text = normalize_whitespace(clean_boilerplate(text))
+    # else: opened but no text - might be scanned images (not an error)
+
+    if key is not None:
+        with _text_cache_lock:
+            _text_cache[key] = (text, cut_at)
+            if len(_text_cache) > _TEXT_CACHE_SIZE:
+                _text_cache.popitem(last=False)
+    return text
+
+
+def prefetch_pdf_text(
+    pdf_paths: Iterable[Path], ahead: int = 2, max_pages: int = 3,
+    max_chars: Optional[int] = None,
+) -> Iterator[Tuple[Path, Optional[str]]]:
+    """
+    Yield ``(pdf_path, text)`` while extracting upcoming PDFs in the background.
+
+    Batch processing is PDF parse (CPU) followed by LLM calls (network) for
+    each file. Extracting the next ``ahead`` files' text on worker threads
+    while the caller handles the current one keeps parsing off the critical
+    path. The readers still run in isolated subprocesses, so a thread only
+    waits on its child.
+
+    ``text`` is None when the PDF yielded no text or extraction failed; the
+    caller should then extract on demand, which surfaces any error normally.
 
+    Args:
+        pdf_paths: PDFs to process, in order
+        ahead: Number of PDFs to extract ahead of the one being yielded
+        max_pages: Maximum number of pages to extract per PDF
+        max_chars: Character budget per PDF (see :func:`extract_text_from_pdf`)
+
+    Yields:
+        Tuple of (pdf_path, text or None)
+    """
+    paths = iter(pdf_paths)
+    pool = ThreadPoolExecutor(max_workers=max(1, ahead))
+    pending = deque()
+    try:
+        for pdf_path in paths:
+            pending.append((pdf_path, pool.submit(extract_text_from_pdf, pdf_path, max_pages, max_chars)))
+            if len(pending) > ahead:
+                break
+        while pending:
+            pdf_path, future = pending.popleft()
+            next_path = next(paths, None)
+            if next_path is not None:
+                pending.append(
+                    (next_path, pool.submit(extract_text_from_pdf, next_path, max_pages, max_chars))
+                )
+            try:
+                text = future.result()
+            except Exception:
+                text = None
+            yield pdf_path, text
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
 
-def truncate_text_for_llm(text: str, max_chars: int = 16000) -> str:
+
+def _piece_tokens(piece: str) -> int:
+    """Estimated token cost of one word or punctuation piece."""
+    return (len(piece) + 3) // 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in text without calling the API.
+
+    Counts word runs at roughly one token per 4 characters (minimum 1) and
+    each punctuation mark as one token. This errs on the high side for
+    English prose, which is the safe direction for staying under a budget.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    return sum(_piece_tokens(m.group(0)) for m in _TOKEN_PIECE_RE.finditer(text))
+
+
+def truncate_text_for_llm(
+    text: str, max_chars: int = 16000, max_tokens: Optional[int] = None
+) -> str:
     """
     Truncate text to fit within LLM token limits.
 
-    Approximately 4 chars = 1 token, so 16000 chars ≈ 4000 tokens
+    By default truncates by characters (approximately 4 chars = 1 token, so
+    16000 chars ≈ 4000 tokens). When ``max_tokens`` is given the cut is made
+    by estimated tokens instead (see :func:`estimate_tokens`), which holds up
+    better for text with many short words, numbers, or non-English content.
 
     Args:
         text: Text to truncate
-        max_chars: Maximum characters to keep
+        max_chars: Maximum characters to keep (ignored if max_tokens is set)
+        max_tokens: Maximum estimated tokens to keep
 
     Returns:
         Truncated text
     """
+    if max_tokens is not None:
+        used = 0
+        for match in _TOKEN_PIECE_RE.finditer(text):
+            used += _piece_tokens(match.group(0))
+            if used > max_tokens:
+                # Cut before the first piece that no longer fits
+                return text[: match.start()].rstrip() + "\n\n[... text truncated ...]"
+        return text
+
     if len(text) <= max_chars:
         return text
 
@@ -221,17 +434,31 @@ def truncate_text_for_llm(text: str, max_chars: int = 16000) -> str:
     return text[:max_chars] + "\n\n[... text truncated ...]"
 
 
+def _has_pdf_header(pdf_path: Path) -> bool:
+    """True if ``%PDF-`` appears in the first 1 KiB, where readers look for it."""
+    try:
+        with open(pdf_path, "rb") as f:
+            return b"%PDF-" in f.read(1024)
+    except OSError:
+        return False
+
+
 def is_pdf_readable(pdf_path: Path) -> tuple[bool, Optional[str]]:
     """
     Check if PDF is readable before expensive metadata extraction.
 
-    Fast early gate: a PDF is readable if ANY reader (pdfplumber, pypdfium2,
+    Fast early gate: a PDF is readable if ANY reader (pypdfium2, pdfplumber,
     pdftotext) can open it and report at least one page. A file that opens but
     yields no text is still "readable" — that's the scanned-image case, handled
     downstream as None text, not corruption. Only when every reader fails to open
     the file is it declared unreadable. The in-process readers run in isolated
     subprocesses so a segfault cannot crash the watcher.
 
+    Cheapest checks first: a file with no ``%PDF-`` header is rejected without
+    starting a reader, and a PDFium page count (no content streams parsed)
+    settles the normal case. Only files PDFium can't open go through the full
+    reader chain.
+
     Args:
         pdf_path: Path to PDF file
 
@@ -240,6 +467,11 @@ def is_pdf_readable(pdf_path: Path) -> tuple[bool, Optional[str]]:
         - is_readable: True if any reader can open the PDF
         - error_reason: None if readable, "all_readers_failed" otherwise
     """
+    if not _has_pdf_header(pdf_path):
+        return False, "all_readers_failed"
+    opened, _text = _run_isolated(_pypdfium2_open_body, pdf_path, 1, None)
+    if opened:
+        return True, None
     opened, _text = _read_pdf_text(pdf_path, max_pages=1)
     if not opened:
         return False, "all_readers_failed"
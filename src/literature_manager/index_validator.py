@@ -1,11 +1,45 @@
 """Index validation and repair utilities."""
 
-import json
-import fcntl
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
+
 from literature_manager.config import Config
-from literature_manager.utils import compute_file_hash
+from literature_manager.operations import (
+    index_write_lock,
+    load_index,
+    read_index_file,
+    save_index,
+)
+from literature_manager.utils import (
+    HASH_ALGORITHM,
+    compute_file_hash,
+    hash_cache_key,
+    prune_hash_cache,
+)
+
+
+def _scan_pdfs(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield directory entries for the real (non-symlink) PDFs under root.
+
+    A scandir walk: file type and symlink checks come from the directory
+    listing itself, and callers can stat through the entry, so no Path
+    object or extra syscall is spent per file. Like rglob, symlinked
+    directories are not descended into.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.pdf') and not entry.is_symlink():
+                        yield entry
+        except OSError:
+            continue  # directory vanished or unreadable
 
 
 def validate_and_repair_index(config: Config, verbose: bool = False) -> Tuple[int, int]:
@@ -24,21 +58,18 @@ def validate_and_repair_index(config: Config, verbose: bool = False) -> Tuple[in
     if verbose:
         print("Validating index...")
 
-    # Load index with non-blocking lock
+    # Load index
     if not config.index_path.exists():
         if verbose:
             print("  No index found, skipping validation")
         return 0, 0
 
+    # Writers replace the file atomically, so a plain read sees a whole index
     try:
-        with open(config.index_path, 'r') as f:
-            # Try to acquire non-blocking shared lock (multiple readers OK)
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
-            index = json.load(f)
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-    except (BlockingIOError, OSError) as e:
+        index = read_index_file(config.index_path)
+    except (OSError, ValueError):
         if verbose:
-            print("  ⚠ Index locked by another process, skipping validation")
+            print("  ⚠ Could not read index, skipping validation")
         return 0, 0
 
     # Scan all PDF locations
@@ -54,39 +85,56 @@ def validate_and_repair_index(config: Config, verbose: bool = False) -> Tuple[in
         if entry.get('filepath'):
             index_by_path[entry['filepath']] = entry
 
+    # Walk the scan dirs up front, then stat/hash the files on a thread pool:
+    # the work is syscalls and hashlib, both of which release the GIL.
+    # Symlinks are skipped by the walk (only index real files).
+    pdf_entries = []
+    for scan_dir in scan_dirs:
+        pdf_entries.extend(_scan_pdfs(scan_dir))
+
+    def hash_pdf(entry: os.DirEntry) -> Tuple[Path, str, bool, str]:
+        """Return (path, file_hash, computed, hash cache key) for a PDF."""
+        pdf_path = Path(entry.path)
+        stat = entry.stat(follow_symlinks=False)
+        cache_key = hash_cache_key(stat)
+        rel_path = str(pdf_path.relative_to(config.workshop_root))
+
+        # Check if we have cached hash with matching mtime/size
+        cached_entry = index_by_path.get(rel_path)
+
+        # Entries written before file_hash_algo existed are SHA-256
+        if (cached_entry
+            and cached_entry.get('file_mtime') == stat.st_mtime
+            and cached_entry.get('file_size') == stat.st_size
+            and cached_entry.get('file_hash_algo', 'sha256') == HASH_ALGORITHM
+            and cached_entry.get('file_hash')):
+            # Use cached hash (file unchanged)
+            return pdf_path, cached_entry['file_hash'], False, cache_key
+
+        # Compute new hash (file changed, moved, or not in index); the
+        # sidecar hash cache still skips the read if the bytes are unchanged
+        file_hash = compute_file_hash(pdf_path, config.hash_cache_path)
+        return pdf_path, file_hash, True, cache_key
+
     # Build map of actual files (hash -> path)
     actual_files = {}
     files_scanned = 0
     hashes_computed = 0
+    seen_keys = set()
 
-    for scan_dir in scan_dirs:
-        if not scan_dir.exists():
-            continue
-
-        for pdf_path in scan_dir.rglob('*.pdf'):
-            # Skip symlinks (only index real files)
-            if pdf_path.is_symlink():
-                continue
-
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # map() keeps walk order, so which path wins for duplicate content
+        # doesn't depend on thread timing
+        for pdf_path, file_hash, computed, cache_key in pool.map(hash_pdf, pdf_entries):
             files_scanned += 1
-            stat = pdf_path.stat()
-            rel_path = str(pdf_path.relative_to(config.workshop_root))
-
-            # Check if we have cached hash with matching mtime/size
-            cached_entry = index_by_path.get(rel_path)
-
-            if (cached_entry
-                and cached_entry.get('file_mtime') == stat.st_mtime
-                and cached_entry.get('file_size') == stat.st_size
-                and cached_entry.get('file_hash')):
-                # Use cached hash (file unchanged)
-                file_hash = cached_entry['file_hash']
-            else:
-                # Compute new hash (file changed or not in index)
-                file_hash = compute_file_hash(pdf_path)
-                hashes_computed += 1
-
+            hashes_computed += computed
             actual_files[file_hash] = pdf_path
+            seen_keys.add(cache_key)
+
+    # The workers shared one in-memory hash cache; drop entries for files
+    # that are gone or were replaced, and write it back once for the run
+    prune_hash_cache(config.hash_cache_path, seen_keys)
 
     # Check index entries against actual files
     repairs_needed = {}
@@ -114,16 +162,15 @@ def validate_and_repair_index(config: Config, verbose: bool = False) -> Tuple[in
 
     # Apply repairs
     if repairs_needed:
-        for file_hash, new_path in repairs_needed.items():
-            index[file_hash]['filepath'] = new_path
-
-        # Save updated index with exclusive lock
+        # Save under the index writer lock, re-reading first so entries added
+        # since the scan started are kept; save_index replaces atomically.
         try:
-            with open(config.index_path, 'w') as f:
-                # Acquire exclusive lock for writing
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                json.dump(index, f, indent=2)
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            with index_write_lock(config.index_path, blocking=False):
+                current = load_index(config.index_path)
+                for file_hash, new_path in repairs_needed.items():
+                    if file_hash in current:
+                        current[file_hash]['filepath'] = new_path
+                save_index(current, config.index_path)
 
             if verbose:
                 print(f"  ✓ Repaired {len(repairs_needed)} path(s)")
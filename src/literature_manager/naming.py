@@ -1,5 +1,6 @@
 """File naming logic for literature PDFs."""
 
+import os
 import re
 from datetime import datetime
 from pathlib import Path
@@ -7,6 +8,22 @@ from typing import Dict, List
 
 from literature_manager.utils import sanitize_filename
 
+# Everything before the first comma of "Last, First"
+_LAST_NAME_RE = re.compile(r"([^,]*),")
+
+# Natural break points for shorten_title
+_BREAK_CHARS = frozenset(":-—,;")
+_TRAILING_BREAK_RE = re.compile(r"[:\-—,;]+$")
+
+
+def _last_name(author: str) -> str:
+    """Last name from "Last, First" or "First Last"."""
+    match = _LAST_NAME_RE.match(author)
+    if match:
+        return match.group(1).strip()
+    parts = author.split()
+    return parts[-1] if parts else author
+
 
 def format_authors(authors: List[str]) -> str:
     """
@@ -28,35 +45,15 @@ def format_authors(authors: List[str]) -> str:
         return "Unknown"
 
     if len(authors) == 1:
-        # Extract just last name
-        name = authors[0]
-        if "," in name:
-            return name.split(",")[0].strip()
-        else:
-            parts = name.split()
-            return parts[-1] if parts else name
+        return _last_name(authors[0])
 
     elif len(authors) == 2:
         # Two authors: "Smith & Jones"
-        names = []
-        for author in authors:
-            if "," in author:
-                last = author.split(",")[0].strip()
-            else:
-                parts = author.split()
-                last = parts[-1] if parts else author
-            names.append(last)
-        return f"{names[0]} & {names[1]}"
+        return f"{_last_name(authors[0])} & {_last_name(authors[1])}"
 
     else:
         # Three or more: "Smith et al."
-        author = authors[0]
-        if "," in author:
-            last = author.split(",")[0].strip()
-        else:
-            parts = author.split()
-            last = parts[-1] if parts else author
-        return f"{last} et al."
+        return f"{_last_name(authors[0])} et al."
 
 
 def shorten_title(title: str, max_words: int = 8) -> str:
@@ -79,17 +76,14 @@ def shorten_title(title: str, max_words: int = 8) -> str:
     if len(words) <= max_words:
         return title.title()
 
-    # Find natural break points (punctuation)
-    break_chars = [":", "-", "—", ",", ";"]
-
-    # Check if any break point exists within max_words
+    # Check if any natural break point (punctuation) exists within max_words
     for i in range(max_words, 0, -1):
         word = words[i - 1] if i <= len(words) else ""
-        if any(char in word for char in break_chars):
+        if not _BREAK_CHARS.isdisjoint(word):
             # Break here
             shortened = " ".join(words[:i])
             # Remove trailing punctuation
-            shortened = re.sub(r"[:\-—,;]+$", "", shortened)
+            shortened = _TRAILING_BREAK_RE.sub("", shortened)
             return shortened.title()
 
     # No natural break point, just truncate
@@ -156,15 +150,25 @@ def resolve_duplicate_filename(dest_dir: Path, filename: str) -> Path:
     if not filepath.exists():
         return filepath
 
-    # File exists, find unique name
+    # File exists, find unique name. List the directory once rather than
+    # stat-ing each candidate; listed names also include broken symlinks,
+    # which exists() would report as free.
     name, ext = filename.rsplit(".", 1) if "." in filename else (filename, "")
+    try:
+        with os.scandir(dest_dir) as entries:
+            existing = {entry.name for entry in entries}
+    except OSError:
+        existing = None
 
     counter = 2
     while True:
         new_filename = f"{name} ({counter}).{ext}" if ext else f"{name} ({counter})"
         new_filepath = dest_dir / new_filename
 
-        if not new_filepath.exists():
+        if existing is not None:
+            if new_filename not in existing:
+                return new_filepath
+        elif not new_filepath.exists():
             return new_filepath
 
         counter += 1
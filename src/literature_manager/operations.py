@@ -1,17 +1,32 @@
 """File operations, duplicate detection, logging, and indexing."""
 
-import json
+import errno
+import fcntl
+import mmap
 import os
 import shutil
+import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
+import orjson
 from slugify import slugify
 
 from literature_manager.config import Config
 from literature_manager.naming import generate_filename, resolve_duplicate_filename
-from literature_manager.utils import compute_file_hash, fuzzy_match_score
+from literature_manager.utils import HASH_ALGORITHM, compute_file_hash
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=256)
+def _topic_slug(topic: str) -> str:
+    """Directory name for a topic; topics come from a small fixed taxonomy."""
+    return slugify(topic)
 
 
 def determine_destination(
@@ -38,13 +53,13 @@ def determine_destination(
     if topics and confidence >= threshold:
         # Primary location: by-topic/{first-topic}/
         primary_topic = topics[0]
-        topic_slug = slugify(primary_topic)
+        topic_slug = _topic_slug(primary_topic)
         primary_dest = config.by_topic_path / topic_slug
 
         # Secondary locations: symlinks to other topics
         secondary_dests = []
         for topic in topics[1:]:  # Skip first topic (already primary)
-            topic_slug = slugify(topic)
+            topic_slug = _topic_slug(topic)
             topic_dir = config.by_topic_path / topic_slug
             secondary_dests.append(topic_dir)
     else:
@@ -55,6 +70,38 @@ def determine_destination(
     return primary_dest, secondary_dests
 
 
+# Directories already created or seen by this process, so filing a batch
+# doesn't stat/mkdir the same topic, recent/ and index directories per paper
+_ensured_dirs = set()
+
+
+def _ensure_dir(directory: Path):
+    """mkdir -p, at most once per directory per process."""
+    if directory not in _ensured_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(directory)
+
+
+def _in_dir(directory: Path, operation: Callable[[], T]) -> T:
+    """
+    Ensure directory exists and run operation, which creates a file in it.
+
+    The watcher is long-lived, so a cached directory may have been removed
+    since (e.g. an emptied topic folder). If the operation fails with
+    FileNotFoundError and the directory is gone, it is recreated and the
+    operation retried once.
+    """
+    _ensure_dir(directory)
+    try:
+        return operation()
+    except FileNotFoundError:
+        if directory.is_dir():
+            raise  # something else is missing (e.g. the source file)
+        _ensured_dirs.discard(directory)
+        _ensure_dir(directory)
+        return operation()
+
+
 def move_and_rename_file(
     source: Path, dest_dir: Path, filename: str, create_symlinks: List[Path] = None
 ) -> Path:
@@ -71,24 +118,34 @@ def move_and_rename_file(
         Final filepath
     """
     # Ensure destination directory exists
-    dest_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(dest_dir)
 
     # Resolve duplicate filename
     dest_path = resolve_duplicate_filename(dest_dir, filename)
 
-    # Move file
-    shutil.move(str(source), str(dest_path))
+    # Move file: a same-filesystem move is a single rename; only a move
+    # across devices (EXDEV) needs shutil's copy + unlink, whose copy goes
+    # through sendfile/fcopyfile in the kernel.
+    def move():
+        try:
+            os.rename(source, dest_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(source), str(dest_path))
+
+    _in_dir(dest_dir, move)
 
     # Create symlinks if specified
     if create_symlinks:
         for symlink_dir in create_symlinks:
-            symlink_dir.mkdir(parents=True, exist_ok=True)
             symlink_path = symlink_dir / dest_path.name
+            target = os.path.relpath(dest_path, symlink_dir)
 
             # Create symlink (relative path for portability — survives a
             # library move; absolute targets would break)
             try:
-                os.symlink(os.path.relpath(dest_path, symlink_dir), symlink_path)
+                _in_dir(symlink_dir, lambda: os.symlink(target, symlink_path))
             except FileExistsError:
                 pass  # Symlink already exists
             except Exception as e:
@@ -97,6 +154,49 @@ def move_and_rename_file(
     return dest_path
 
 
+# Linux FICLONE ioctl, _IOW(0x94, 9, int); fcntl only names it from 3.12
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+
+@lru_cache(maxsize=1)
+def _libc():
+    import ctypes
+
+    return ctypes.CDLL(None, use_errno=True)
+
+
+def _clone_file(source: Path, dest: Path) -> bool:
+    """
+    Copy-on-write clone of source to a new file dest, if the filesystem can.
+
+    APFS (clonefile) and Btrfs/XFS (FICLONE) share the data blocks until one
+    side is written, so the copy costs neither time nor space. The clone is
+    an independent file, unlike a hardlink. Returns False, leaving no dest
+    behind, when cloning isn't supported here.
+    """
+    if sys.platform == "darwin":
+        try:
+            clonefile = _libc().clonefile
+        except (OSError, AttributeError):
+            return False
+        return clonefile(os.fsencode(source), os.fsencode(dest), 0) == 0
+
+    if sys.platform.startswith("linux"):
+        with open(source, "rb") as src:
+            mode = os.fstat(src.fileno()).st_mode & 0o777
+            fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+            try:
+                fcntl.ioctl(fd, _FICLONE, src.fileno())
+            except OSError:
+                os.close(fd)
+                os.unlink(dest)
+                return False
+            os.close(fd)
+        return True
+
+    return False
+
+
 def copy_to_recent(source_path: Path, recent_dir: Path) -> Optional[Path]:
     """
     Copy file to recent directory (for 3-day window).
@@ -111,7 +211,7 @@ def copy_to_recent(source_path: Path, recent_dir: Path) -> Optional[Path]:
     import time
 
     try:
-        recent_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(recent_dir)
         dest_path = recent_dir / source_path.name
 
         # Don't copy if already in recent
@@ -126,8 +226,18 @@ def copy_to_recent(source_path: Path, recent_dir: Path) -> Optional[Path]:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                # Use shutil.copy instead of copy2 to avoid extended attribute issues
-                shutil.copy(str(source_path), str(dest_path))
+                # Clone where the filesystem supports it. Otherwise use
+                # shutil.copy instead of copy2 to avoid extended attribute
+                # issues. Either way the copy gets a fresh mtime, which
+                # cleanup's retention window counts from (a hardlink would
+                # share the library file's mtime).
+                def copy():
+                    if _clone_file(source_path, dest_path):
+                        os.utime(dest_path)
+                    else:
+                        shutil.copy(str(source_path), str(dest_path))
+
+                _in_dir(recent_dir, copy)
                 return dest_path
             except OSError as e:
                 if e.errno == 11 and attempt < max_retries - 1:  # Resource deadlock
@@ -142,6 +252,96 @@ def copy_to_recent(source_path: Path, recent_dir: Path) -> Optional[Path]:
         return None
 
 
+# update_index appends new entries to an NDJSON journal next to the index
+# instead of rewriting the whole file; readers replay it over the snapshot.
+# Once the journal reaches this size (or half the snapshot) it is folded in.
+_JOURNAL_COMPACT_BYTES = 1024 * 1024
+
+
+def _journal_path(index_path: Path) -> Path:
+    return index_path.with_suffix(".journal")
+
+
+def _lock_path(index_path: Path) -> Path:
+    return index_path.with_suffix(".lock")
+
+
+# Index locks held by the calling thread: lock path -> journal bytes already
+# reflected in the index last read under that lock (None if none was read)
+_held_index_locks = threading.local()
+
+
+def _held_locks() -> Dict[Path, Optional[int]]:
+    held = getattr(_held_index_locks, "locks", None)
+    if held is None:
+        held = _held_index_locks.locks = {}
+    return held
+
+
+def _replay_journal(
+    index: Dict, journal_path: Path, start: int = 0, missing_only: bool = False
+) -> int:
+    """
+    Apply journaled entries (one JSON object per line) to index in place.
+
+    Args:
+        index: Index to update
+        journal_path: Path to the journal
+        start: Journal offset to replay from
+        missing_only: Only add entries whose file_hash index lacks
+
+    Returns:
+        Journal offset up to which complete lines were applied
+    """
+    try:
+        data = journal_path.read_bytes()
+    except FileNotFoundError:
+        return 0
+    # A trailing line without its newline is an append still in progress
+    end = data.rfind(b"\n") + 1
+    if end <= start:
+        return start
+    for line in data[start:end].split(b"\n")[:-1]:
+        try:
+            entry = orjson.loads(line)
+        except ValueError:
+            continue  # torn write from a crash; the rest is still good
+        if not (missing_only and entry["file_hash"] in index):
+            index[entry["file_hash"]] = entry
+    return end
+
+
+def read_index_file(index_path: Path) -> Dict:
+    """
+    Parse the index file plus its journal, raising on any error.
+
+    The file is memory-mapped and parsed straight from the page cache, so a
+    large index isn't first copied into a Python bytes object.
+
+    Raises:
+        OSError: If the file can't be opened or mapped
+        ValueError: If the file is empty or not valid JSON
+    """
+    journal_path = _journal_path(index_path)
+    held = _held_locks()
+    lock_path = _lock_path(index_path)
+    if lock_path in held:
+        held[lock_path] = None
+    while True:
+        with open(index_path, "rb") as f:
+            ino = os.fstat(f.fileno()).st_ino
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    index = orjson.loads(view)
+        journal_end = _replay_journal(index, journal_path)
+        # save_index replaces the snapshot before dropping the journal, so if
+        # the snapshot is unchanged the journal we read belongs to it
+        if os.stat(index_path).st_ino == ino:
+            if lock_path in held:
+                held[lock_path] = journal_end
+            return index
+
+
 def load_index(index_path: Path) -> Dict:
     """
     Load literature index from JSON.
@@ -156,8 +356,7 @@ def load_index(index_path: Path) -> Dict:
         return {}
 
     try:
-        with open(index_path, "r") as f:
-            return json.load(f)
+        return read_index_file(index_path)
     except Exception:
         return {}
 
@@ -166,24 +365,154 @@ def save_index(index: Dict, index_path: Path):
     """
     Save literature index to JSON.
 
+    Writes the full index and drops the journal. Journal entries appended
+    since index was read under the caller's index_write_lock are first
+    replayed into it, so they survive the drop; if index wasn't read under
+    this lock, journaled papers it lacks are added.
+
     Args:
         index: Index dictionary
         index_path: Path to index file
+
+    Raises:
+        RuntimeError: If the calling thread doesn't hold index_write_lock
     """
-    index_path.parent.mkdir(parents=True, exist_ok=True)
+    held = _held_locks()
+    lock_path = _lock_path(index_path)
+    if lock_path not in held:
+        raise RuntimeError(f"save_index requires index_write_lock on {index_path}")
+
+    journal_path = _journal_path(index_path)
+    if held[lock_path] is None:
+        _replay_journal(index, journal_path, missing_only=True)
+    else:
+        _replay_journal(index, journal_path, start=held[lock_path])
+
+    _ensure_dir(index_path.parent)
 
     # Atomic write: a crash mid-write (e.g. launchd kill) must not corrupt the
     # index into an unparseable state that load_index silently turns into {}.
+    # orjson's C encoder is ~10x faster than json.dump(indent=2) on a large
+    # index and produces the same 2-space layout (UTF-8 rather than \u escapes).
     temp_path = index_path.with_suffix(".tmp")
     try:
-        with open(temp_path, "w") as f:
-            json.dump(index, f, indent=2)
+        temp_path.write_bytes(orjson.dumps(index, option=orjson.OPT_INDENT_2))
         temp_path.replace(index_path)
     except Exception:
         if temp_path.exists():
             temp_path.unlink()
         raise
 
+    try:
+        journal_path.unlink()
+    except FileNotFoundError:
+        pass
+    held[lock_path] = 0
+
+
+def append_index_entry(entry: Dict, index_path: Path):
+    """
+    Add or replace one index entry without rewriting the index.
+
+    The entry is appended to the journal in a single O_APPEND write, and the
+    journal is compacted into the index once it grows past half the index
+    size. Callers must hold index_write_lock.
+
+    Args:
+        entry: Index entry, keyed by its file_hash
+        index_path: Path to index file
+    """
+    try:
+        index_size = index_path.stat().st_size
+    except FileNotFoundError:
+        # First entry: there is no snapshot to journal against yet
+        index = load_index(index_path)
+        index[entry["file_hash"]] = entry
+        save_index(index, index_path)
+        return
+
+    journal_path = _journal_path(index_path)
+    fd = os.open(journal_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        line = orjson.dumps(entry) + b"\n"
+        size = os.fstat(fd).st_size
+        if size and os.pread(fd, 1, size - 1) != b"\n":
+            line = b"\n" + line  # don't glue onto a line torn by a crash
+        os.write(fd, line)
+        journal_size = os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+    if journal_size >= max(_JOURNAL_COMPACT_BYTES, index_size // 2):
+        save_index(load_index(index_path), index_path)
+
+
+@contextmanager
+def index_write_lock(index_path: Path, blocking: bool = True):
+    """
+    Serialize read-modify-write cycles on the index across processes.
+
+    The watcher, CLI commands and the validator all load the whole index,
+    change it and save it back; without a shared lock two overlapping cycles
+    silently drop one side's update. The lock lives in a sidecar file because
+    save_index replaces the index file itself. It is not reentrant; the
+    calling thread is recorded as the holder, which save_index checks.
+
+    Args:
+        index_path: Path to index file
+        blocking: Wait for the lock; if False, raise BlockingIOError when
+            another writer holds it
+
+    Raises:
+        BlockingIOError: If blocking is False and the lock is taken
+        RuntimeError: If the calling thread already holds the lock (flock
+            would otherwise wait on itself forever)
+    """
+    lock_path = _lock_path(index_path)
+    held = _held_locks()
+    if lock_path in held:
+        raise RuntimeError(f"index_write_lock on {index_path} is already held by this thread")
+    with _in_dir(lock_path.parent, lambda: open(lock_path, "a")) as f:
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        fcntl.flock(f.fileno(), flags)
+        held[lock_path] = None
+        try:
+            yield
+        finally:
+            del held[lock_path]
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def update_index_entries(
+    index_path: Path, changed: Dict[str, Dict], removed: Iterable[str] = ()
+):
+    """
+    Write a command's changes to index entries back to the current index.
+
+    Commands that spend minutes on a loaded index (LLM or CrossRef calls per
+    paper) don't hold index_write_lock meanwhile; instead the index is
+    reloaded under the lock and only their entries replaced or removed, so
+    papers the watcher filed during the run are kept. Entries removed from
+    the index since the command loaded it are not brought back.
+
+    Args:
+        index_path: Path to index file
+        changed: file_hash -> updated entry
+        removed: file_hashes to drop from the index
+    """
+    removed = set(removed)
+    if not changed and not removed:
+        return
+
+    with index_write_lock(index_path):
+        index = load_index(index_path)
+        for file_hash, entry in changed.items():
+            if file_hash in index:
+                index[file_hash] = entry
+        for file_hash in removed:
+            index.pop(file_hash, None)
+        save_index(index, index_path)
+
 
 def update_index(metadata: Dict, filepath: Path, config: Config):
     """
@@ -194,8 +523,6 @@ def update_index(metadata: Dict, filepath: Path, config: Config):
         filepath: Final filepath of paper
         config: Configuration object
     """
-    index = load_index(config.index_path)
-
     # Create entry
     stat = filepath.stat()
     entry = {
@@ -213,7 +540,8 @@ def update_index(metadata: Dict, filepath: Path, config: Config):
         "extraction_method": metadata.get("extraction_method", ""),
         "extraction_confidence": metadata.get("extraction_confidence", 0.0),
         "processed_date": datetime.now().isoformat(),
-        "file_hash": compute_file_hash(filepath),
+        "file_hash": compute_file_hash(filepath, config.hash_cache_path),
+        "file_hash_algo": HASH_ALGORITHM,
         "file_size": stat.st_size,
         "file_mtime": stat.st_mtime,
         # LLM-generated summary (short, for filename)
@@ -234,13 +562,54 @@ def update_index(metadata: Dict, filepath: Path, config: Config):
         entry["enhanced_summary"] = metadata["enhanced_summary"]
 
     # Use file hash as key (unique identifier)
-    index[entry["file_hash"]] = entry
+    with index_write_lock(config.index_path):
+        append_index_entry(entry, config.index_path)
+
+
+# Open O_APPEND descriptor for the processing log (config.log_path), kept
+# across entries instead of reopening the file per paper:
+# (abspath, fd, st_dev, st_ino)
+_action_log = None
 
-    save_index(index, config.index_path)
+
+def _action_log_fd(log_path: Path) -> int:
+    """
+    Return the processing log's descriptor, reopening it if needed.
+
+    Like logging's WatchedFileHandler, the file is reopened if it was rotated
+    or deleted under the long-running watcher (its dev/inode changed).
+    """
+    global _action_log
+    path = os.path.abspath(log_path)
+    if _action_log is not None:
+        opened_path, fd, dev, ino = _action_log
+        if opened_path == path:
+            try:
+                st = os.stat(path)
+                if (st.st_dev, st.st_ino) == (dev, ino):
+                    return fd
+            except FileNotFoundError:
+                pass
+        os.close(fd)
+        _action_log = None
+
+    fd = _in_dir(
+        log_path.parent,
+        lambda: os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644),
+    )
+    st = os.fstat(fd)
+    _action_log = (path, fd, st.st_dev, st.st_ino)
+    return fd
 
 
 def log_action(
-    action: str, metadata: Dict, source: Path, destination: Path, config: Config, **kwargs
+    action: str,
+    metadata: Dict,
+    source: Path,
+    destination: Path,
+    config: Config,
+    display_name: Optional[str] = None,
+    **kwargs,
 ):
     """
     Log processing action to log file.
@@ -251,87 +620,177 @@ def log_action(
         source: Source filepath
         destination: Destination filepath
         config: Configuration object
+        display_name: Filename already generated for this paper; generated
+            from metadata when None
         **kwargs: Additional info to log
     """
-    log_path = config.log_path
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    # Generate filename from metadata
-    from literature_manager.naming import generate_filename
+    if display_name is None:
+        display_name = generate_filename(metadata)
 
-    display_name = generate_filename(metadata)
-
-    log_entry = f"{timestamp} | {action} | {display_name}\n"
-    log_entry += f"  → Source: {source.name}\n"
-    log_entry += f"  → Destination: {destination.relative_to(config.workshop_root)}\n"
+    lines = [
+        f"{timestamp} | {action} | {display_name}",
+        f"  → Source: {source.name}",
+        f"  → Destination: {destination.relative_to(config.workshop_root)}",
+    ]
 
     if "confidence" in kwargs:
-        log_entry += f"  → Confidence: {kwargs['confidence']:.0%}\n"
+        lines.append(f"  → Confidence: {kwargs['confidence']:.0%}")
     if "method" in kwargs:
-        log_entry += f"  → Method: {kwargs['method']}\n"
+        lines.append(f"  → Method: {kwargs['method']}")
     if "topic" in kwargs:
-        log_entry += f"  → Topic: {kwargs['topic']}\n"
+        lines.append(f"  → Topic: {kwargs['topic']}")
     if "reason" in kwargs:
-        log_entry += f"  → Reason: {kwargs['reason']}\n"
+        lines.append(f"  → Reason: {kwargs['reason']}")
 
     # Enhanced error details for ERROR actions
     if action == "ERROR" and "errors" in metadata and metadata["errors"]:
         # Show what methods were attempted and why they failed (first 3 errors)
         error_details = "; ".join(metadata["errors"][:3])
-        log_entry += f"  → Details: {error_details}\n"
+        lines.append(f"  → Details: {error_details}")
 
-    log_entry += "\n"
+    # One string, one write: the entry and its trailing blank line
+    log_entry = "\n".join(lines) + "\n\n"
 
-    with open(log_path, "a") as f:
-        f.write(log_entry)
+    # One O_APPEND write per entry: the kernel positions it at the end of
+    # file, so entries from the watcher and a CLI run don't interleave
+    data = log_entry.encode("utf-8")
+    fd = _action_log_fd(config.log_path)
+    while data:
+        data = data[os.write(fd, data):]
 
 
-def check_duplicate_by_doi(doi: str, index: Dict) -> Optional[str]:
+def _best_title_match(title: str, titles: List[str], threshold: float) -> Optional[int]:
     """
-    Check if paper with DOI already exists in index.
+    Position of the most similar lowercased title at or above threshold, or None.
+
+    rapidfuzz's extractOne scores all candidates in C and uses score_cutoff
+    to skip those it can rule out early. The score is the normalized Indel
+    similarity (the exact-LCS form of difflib's ratio), as in
+    find_similar_titles.
 
     Args:
-        doi: DOI string
-        index: Current index
+        title: Incoming title
+        titles: Lowercased titles
+        threshold: Similarity threshold (0-1)
+    """
+    from rapidfuzz import fuzz, process
 
-    Returns:
-        Filepath of duplicate if found, None otherwise
+    match = process.extractOne(
+        title.lower(), titles, scorer=fuzz.ratio, score_cutoff=threshold * 100
+    )
+    return match[2] if match is not None else None
+
+
+def _index_identity(index_path: Path) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Cheap fingerprint of the index state, or None if there is no index.
+
+    save_index replaces the file, so any rewrite gives a new (inode, mtime,
+    size); between rewrites the journal only grows, so its size marks
+    appended entries.
     """
-    if not doi:
+    try:
+        st = index_path.stat()
+    except OSError:
         return None
+    try:
+        journal_size = _journal_path(index_path).stat().st_size
+    except OSError:
+        journal_size = 0
+    return st.st_ino, st.st_mtime_ns, st.st_size, journal_size
 
-    for entry in index.values():
-        if entry.get("doi") == doi and doi:
-            return entry.get("filepath")
 
-    return None
+@lru_cache(maxsize=4)
+def _duplicate_lookups(
+    index_path: Path, identity: Tuple[int, int, int, int]
+) -> Tuple[Dict, Dict[str, str], Dict[str, str]]:
+    """
+    Load the index with DOI and exact-title lookup maps.
+
+    Cached on the index identity, so the next call after any write reloads.
+    The returned dicts are shared between calls and must not be modified.
+
+    Returns:
+        Tuple of (index, doi -> filepath, lowercased title -> filepath)
+    """
+    index = load_index(index_path)
+    by_doi = {}
+    by_title = {}
+    for entry in index.values():
+        # setdefault keeps the first entry, matching the order of a scan
+        if entry.get("doi"):
+            by_doi.setdefault(entry["doi"], entry.get("filepath"))
+        if entry.get("title"):
+            by_title.setdefault(entry["title"].lower(), entry.get("filepath"))
+    return index, by_doi, by_title
 
 
-def check_duplicate_by_title(title: str, index: Dict, threshold: float = 0.90) -> Optional[str]:
+def cached_index(index_path: Path) -> Dict:
     """
-    Check if paper with similar title exists in index.
+    Load the index for read-only use, reparsing only after it changes.
+
+    A batch ingest checks every incoming PDF against the index; this costs a
+    couple of stats per call instead of a full parse. The returned dict is
+    shared between callers and must not be modified: anything that edits
+    the index should load_index under index_write_lock.
 
     Args:
-        title: Paper title
-        index: Current index
-        threshold: Similarity threshold
+        index_path: Path to index file
 
     Returns:
-        Filepath of duplicate if found, None otherwise
+        Index dictionary (empty if there is no index yet)
     """
-    if not title:
-        return None
+    identity = _index_identity(index_path)
+    if identity is None:
+        return {}
+    return _duplicate_lookups(index_path, identity)[0]
 
-    for entry in index.values():
-        existing_title = entry.get("title", "")
-        if existing_title:
-            similarity = fuzzy_match_score(title, existing_title)
-            if similarity >= threshold:
-                return entry.get("filepath")
 
-    return None
+def find_similar_titles(
+    index: Dict, threshold: float = 0.90, block_size: int = 500
+) -> List[Tuple[str, str, float]]:
+    """
+    Find pairs of index entries with near-identical titles.
+
+    Scores every title against every other with rapidfuzz's ``cdist``, which
+    runs the whole comparison matrix in C across all cores, one block of rows
+    at a time to bound memory. The score is rapidfuzz's normalized Indel
+    similarity on lowercased titles (the exact-LCS form of difflib's ratio).
+
+    Args:
+        index: Current index
+        threshold: Similarity threshold (0-1)
+        block_size: Rows of the comparison matrix computed per call
+
+    Returns:
+        List of (hash_a, hash_b, score) tuples, most similar first
+    """
+    import numpy as np
+    from rapidfuzz import fuzz, process
+
+    hashes = [h for h, entry in index.items() if entry.get("title")]
+    titles = [index[h]["title"] for h in hashes]
+
+    pairs = []
+    for start in range(0, len(titles), block_size):
+        scores = process.cdist(
+            titles[start : start + block_size],
+            titles,
+            scorer=fuzz.ratio,
+            processor=str.lower,
+            score_cutoff=threshold * 100,
+            workers=-1,
+        )
+        # Scores under the cutoff come back as 0; keep each pair once
+        for row, col in zip(*np.nonzero(scores)):
+            i = start + int(row)
+            if i < col:
+                pairs.append((hashes[i], hashes[col], float(scores[row, col]) / 100))
+
+    pairs.sort(key=lambda pair: pair[2], reverse=True)
+    return pairs
 
 
 def check_duplicate(metadata: Dict, config: Config) -> Optional[Tuple[str, str]]:
@@ -345,19 +804,28 @@ def check_duplicate(metadata: Dict, config: Config) -> Optional[Tuple[str, str]]
     Returns:
         Tuple of (method, filepath) if duplicate found, None otherwise
     """
-    index = load_index(config.index_path)
+    identity = _index_identity(config.index_path)
+    if identity is None:
+        return None  # no index yet, nothing to duplicate
+    _, by_doi, by_title = _duplicate_lookups(config.index_path, identity)
 
     # Check by DOI first (most reliable)
     doi = metadata.get("doi")
     if doi:
-        duplicate = check_duplicate_by_doi(doi, index)
+        duplicate = by_doi.get(doi)
         if duplicate:
             return ("doi", duplicate)
 
-    # Check by title similarity
+    # Check by title similarity (an identical title needs no fuzzy scan);
+    # by_title's keys are already the distinct lowercased titles
     title = metadata.get("title")
     if title:
-        duplicate = check_duplicate_by_title(title, index)
+        duplicate = by_title.get(title.lower())
+        if not duplicate and by_title:
+            titles = list(by_title)
+            match = _best_title_match(title, titles, 0.90)
+            if match is not None:
+                duplicate = by_title[titles[match]]
         if duplicate:
             return ("title", duplicate)
 
@@ -1,13 +1,18 @@
 """Topic taxonomy management for literature categorization."""
 
 import logging
+import os
+from functools import lru_cache
 
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 _REQUIRED_TOPIC_KEYS = {"slug", "category", "description"}
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _find_topics_yml() -> Path:
     """Locate topics.yml robustly.
@@ -20,8 +25,6 @@ def _find_topics_yml() -> Path:
     WorkingDirectory), and the legacy repo-root layout. First existing wins;
     else raise with the list tried.
     """
-    import os
-
     candidates = []
     env = os.getenv("LITERATURE_MANAGER_TOPICS")
     if env:
@@ -51,7 +54,7 @@ class TopicTaxonomy:
             taxonomy_path = _find_topics_yml()
 
         with open(taxonomy_path, "r") as f:
-            self.data = yaml.safe_load(f)
+            self.data = yaml.load(f, Loader=_YAML_LOADER)
 
         # Validate and drop malformed topic entries so a single bad entry can't
         # crash processing later (the May-2026 KeyError: 'description' class).
@@ -77,6 +80,15 @@ class TopicTaxonomy:
                 self._topics_by_category[category] = []
             self._topics_by_category[category].append(topic)
 
+        # Disallowed pairs as unordered keys, mapped to the pair as written
+        self._disallowed_pairs: Dict[FrozenSet[str], List[str]] = {
+            frozenset(pair): pair
+            for pair in self.data["pairing_rules"]["disallowed"]
+        }
+
+        # format_for_prompt output, built on first use
+        self._prompt_text: Optional[str] = None
+
     def get_all_topics(self) -> List[Dict]:
         """Get all topics as list of dicts."""
         return self.data["topics"]
@@ -102,7 +114,11 @@ class TopicTaxonomy:
         Format taxonomy for inclusion in LLM prompt.
 
         Returns formatted string organized by category with topic names and descriptions.
+        The text only depends on the taxonomy, so it is built once per instance.
         """
+        if self._prompt_text is not None:
+            return self._prompt_text
+
         lines = []
         lines.append("ALLOWED TOPICS:")
         lines.append("")
@@ -120,7 +136,8 @@ class TopicTaxonomy:
 
             lines.append("")
 
-        return "\n".join(lines)
+        self._prompt_text = "\n".join(lines)
+        return self._prompt_text
 
     def validate_topics(self, topics: List[str]) -> Tuple[List[str], List[str]]:
         """
@@ -155,10 +172,9 @@ class TopicTaxonomy:
             Tuple of (allowed, reason)
         """
         # Check disallowed pairs
-        disallowed = self.data["pairing_rules"]["disallowed"]
-        for pair in disallowed:
-            if set([topic1, topic2]) == set(pair):
-                return False, f"Disallowed pair: {pair[0]} and {pair[1]} are too redundant"
+        pair = self._disallowed_pairs.get(frozenset((topic1, topic2)))
+        if pair is not None:
+            return False, f"Disallowed pair: {pair[0]} and {pair[1]} are too redundant"
 
         # Check if both topics exist
         if topic1 not in self._topics_by_slug or topic2 not in self._topics_by_slug:
@@ -177,3 +193,27 @@ class TopicTaxonomy:
         if topic:
             return topic["category"] == "analytical-methods"
         return False
+
+
+@lru_cache(maxsize=8)
+def _cached_taxonomy(path: Path, mtime_ns: int, size: int) -> TopicTaxonomy:
+    """Parse topics.yml, cached on the file's (path, mtime, size)."""
+    return TopicTaxonomy(path)
+
+
+def load_taxonomy(taxonomy_path: Optional[Path] = None) -> TopicTaxonomy:
+    """
+    Return the topic taxonomy, parsing topics.yml only when it changes.
+
+    A batch enhances every paper against the same taxonomy, so re-reading
+    the YAML per paper is wasted work. Editing topics.yml changes its
+    mtime/size and the next call reloads. The returned object is shared
+    between callers and must not be modified.
+
+    Args:
+        taxonomy_path: Path to topics.yml file. If None, uses default location.
+    """
+    if taxonomy_path is None:
+        taxonomy_path = _find_topics_yml()
+    st = os.stat(taxonomy_path)
+    return _cached_taxonomy(Path(taxonomy_path), st.st_mtime_ns, st.st_size)
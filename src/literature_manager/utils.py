@@ -1,15 +1,43 @@
 """Utility functions for Literature Manager."""
 
+import atexit
 import hashlib
+import os
 import re
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set
 
+import orjson
 
+
+# Characters that are unsafe or awkward in filenames, and their replacements
+_FILENAME_TRANSLATION = str.maketrans({
+    "/": "-",
+    "\\": "-",
+    ":": " -",
+    "*": "",
+    "?": "",
+    '"': "'",
+    "<": "",
+    ">": "",
+    "|": "-",
+})
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# DOI regex pattern
+_DOI_RE = re.compile(r"10\.\d{4,9}/[-._;()/:a-zA-Z0-9]+")
+
+
+@lru_cache(maxsize=4096)
 def sanitize_filename(filename: str, max_length: int = 200) -> str:
     """
     Sanitize filename for filesystem compatibility.
 
+    Pure function of its arguments, so results are memoized.
+
     Args:
         filename: Original filename
         max_length: Maximum length for filename
@@ -17,27 +45,15 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
     Returns:
         Sanitized filename
     """
-    # Replace problematic characters
-    replacements = {
-        "/": "-",
-        "\\": "-",
-        ":": " -",
-        "*": "",
-        "?": "",
-        '"': "'",
-        "<": "",
-        ">": "",
-        "|": "-",
-    }
-
-    for old, new in replacements.items():
-        filename = filename.replace(old, new)
+    # Replace problematic characters (one pass over the string)
+    filename = filename.translate(_FILENAME_TRANSLATION)
 
     # Remove any remaining non-printable characters
-    filename = "".join(char for char in filename if char.isprintable())
+    if not filename.isprintable():
+        filename = "".join(char for char in filename if char.isprintable())
 
     # Collapse multiple spaces
-    filename = re.sub(r"\s+", " ", filename)
+    filename = _WHITESPACE_RE.sub(" ", filename)
 
     # Trim to max length (preserve extension)
     if len(filename) > max_length:
@@ -51,21 +67,133 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
     return filename.strip()
 
 
-def compute_file_hash(filepath: Path) -> str:
+# Hash used for index keys. Entries record it as ``file_hash_algo`` so cached
+# hashes are only trusted when they were made with the current algorithm.
+HASH_ALGORITHM = "sha256"
+_HASH_BUFFER_SIZE = 1024 * 1024
+
+
+# Hash caches loaded from disk, by cache file path. Keyed on file identity
+# ("dev:ino"), so a rename or move into the library keeps its entry. Hashing
+# runs on worker threads (index validation), so the lock covers loading,
+# updating and writing them.
+_hash_caches: Dict[Path, Dict[str, Dict]] = {}
+_dirty_hash_caches = set()
+_hash_cache_lock = threading.Lock()
+
+
+def hash_cache_key(st: os.stat_result) -> str:
+    """Hash cache key of a file: its identity, stable across renames."""
+    return f"{st.st_dev}:{st.st_ino}"
+
+
+def _load_hash_cache(cache_path: Path) -> Dict[str, Dict]:
+    """Load a hash cache on first use; it is written back at exit."""
+    with _hash_cache_lock:
+        cache = _hash_caches.get(cache_path)
+        if cache is None:
+            try:
+                cache = orjson.loads(cache_path.read_bytes())
+            except (OSError, ValueError):
+                cache = {}
+            if not _hash_caches:
+                atexit.register(flush_hash_caches)
+            _hash_caches[cache_path] = cache
+        return cache
+
+
+def flush_hash_caches():
+    """Write hash caches that changed back to disk (atomically)."""
+    with _hash_cache_lock:
+        for cache_path in list(_dirty_hash_caches):
+            temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path.write_bytes(orjson.dumps(_hash_caches[cache_path]))
+                temp_path.replace(cache_path)
+            except OSError:
+                # Only a cache: next run re-hashes
+                if temp_path.exists():
+                    temp_path.unlink()
+                continue
+            _dirty_hash_caches.discard(cache_path)
+
+
+def prune_hash_cache(cache_path: Path, keep: Set[str]):
+    """
+    Drop cached hashes except those for keep, and write the cache back.
+
+    Entries are keyed by file identity, so those of deleted or replaced
+    files are never looked up again; a full library scan passes the keys
+    of the files it saw.
+
+    Args:
+        cache_path: Sidecar JSON of previously computed hashes
+        keep: hash_cache_key of each file whose entry should stay
+    """
+    cache = _load_hash_cache(cache_path)
+    with _hash_cache_lock:
+        stale = cache.keys() - keep
+        for key in stale:
+            del cache[key]
+        if stale:
+            _dirty_hash_caches.add(cache_path)
+    flush_hash_caches()
+
+
+def compute_file_hash(filepath: Path, cache_path: Optional[Path] = None) -> str:
     """
     Compute SHA256 hash of file.
 
+    Reads into one reusable buffer, so no bytes object is allocated per chunk
+    (hashlib.file_digest does the same in C where available).
+    With cache_path, a file whose identity, size and mtime match a cached
+    entry is not read at all.
+
     Args:
         filepath: Path to file
+        cache_path: Optional sidecar JSON of previously computed hashes
 
     Returns:
         Hex digest of file hash
     """
-    sha256 = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    if cache_path is not None:
+        st = os.stat(filepath)
+        key = hash_cache_key(st)
+        cache = _load_hash_cache(cache_path)
+        cached = cache.get(key)
+        if (cached
+            and cached.get("size") == st.st_size
+            and cached.get("mtime_ns") == st.st_mtime_ns
+            and cached.get("algo") == HASH_ALGORITHM):
+            return cached["hash"]
+
+    with open(filepath, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the read/update loop runs in C
+            digest = hashlib.file_digest(f, HASH_ALGORITHM)
+        else:
+            digest = hashlib.new(HASH_ALGORITHM)
+            buffer = bytearray(_HASH_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                digest.update(view[:n])
+    file_hash = digest.hexdigest()
+
+    if cache_path is not None:
+        with _hash_cache_lock:
+            cache[key] = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "algo": HASH_ALGORITHM,
+                "hash": file_hash,
+            }
+            _dirty_hash_caches.add(cache_path)
+
+    return file_hash
 
 
 def extract_doi_from_text(text: str) -> Optional[str]:
@@ -81,9 +209,7 @@ def extract_doi_from_text(text: str) -> Optional[str]:
     Returns:
         DOI string if found, None otherwise
     """
-    # DOI regex pattern
-    doi_pattern = r"10\.\d{4,9}/[-._;()/:a-zA-Z0-9]+"
-    matches = re.findall(doi_pattern, text)
+    matches = _DOI_RE.findall(text)
 
     if not matches:
         return None
@@ -111,23 +237,5 @@ def normalize_whitespace(text: str) -> str:
         Text with normalized whitespace
     """
     # Replace multiple whitespace with single space
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     return text.strip()
-
-
-def fuzzy_match_score(str1: str, str2: str) -> float:
-    """
-    Calculate similarity score between two strings.
-
-    Uses simple character-based comparison.
-
-    Args:
-        str1: First string
-        str2: Second string
-
-    Returns:
-        Similarity score between 0.0 and 1.0
-    """
-    from difflib import SequenceMatcher
-
-    return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
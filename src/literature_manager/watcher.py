@@ -55,11 +55,15 @@ def run_watch(config, verbose: bool = True) -> None:
     # access to ~/Desktop — that denial, not FSEvents, was the silent exit-78
     # spawn failure. The watcher process can still write the library under
     # ~/Desktop; only launchd's own log-file open must live elsewhere.
+    # The package's own records (Zotero sync progress) don't propagate here:
+    # its logger prints them to stdout (watch.log). Keep it at INFO even if
+    # an embedding application raised its level.
     logging.basicConfig(
         stream=sys.stderr,
         level=logging.INFO,
         format="%(asctime)s | %(levelname)s | %(message)s",
     )
+    logging.getLogger("literature_manager").setLevel(logging.INFO)
     logging.info("watcher starting (pid=%s)", os.getpid())
 
     # Single-instance lock.
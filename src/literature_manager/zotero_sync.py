@@ -1,15 +1,173 @@
 """Zotero library synchronization."""
 
+import copy
+import functools
+import hashlib
+import html
+import io
+import logging
 import os
+import re
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
-from pyzotero import zotero
+from typing import Callable, Dict, List, Optional, Tuple
+
+import orjson
+import requests
+from pyzotero import zotero, zotero_errors
+
+logger = logging.getLogger(__name__)
+
+# DOI index persisted between runs, refreshed incrementally by library version
+_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or "~/.cache").expanduser() / "literature_manager"
+
+# Item templates by (itemType, linkMode); the schema is the same for every
+# library, so one fetch per type serves all clients and threads
+_ITEM_TEMPLATES: Dict[Tuple[str, Optional[str]], Dict] = {}
+
+# Zotero Web API, used directly for the file upload steps
+_WEB_API_URL = "https://api.zotero.org"
+
+# PDF uploads: read/hash block size and storage request timeout (seconds)
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+_UPLOAD_TIMEOUT = 120
+
+# Zotero desktop's local API (Settings → Advanced → "Allow other applications
+# on this computer to communicate with Zotero"); read-only
+_LOCAL_API_URL = "http://127.0.0.1:23119/api/"
+
+# URL form of a DOI ("https://doi.org/10...", "http://dx.doi.org/10...")
+_DOI_PREFIX = re.compile(r'^https?://(?:dx\.)?doi\.org/', re.IGNORECASE)
+
+# Runs of punctuation/whitespace, folded to one space in title keys
+_TITLE_SEPARATORS = re.compile(r'[\W_]+')
+
+# Child items; never matched as papers by title
+_CHILD_ITEM_TYPES = frozenset(('attachment', 'note', 'annotation'))
+
+# Summary note layout: headed sections from the LLM summary, then a list of
+# research details from the domain attributes
+_NOTE_HEADER = "<h2>📋 Paper Summary</h2>"
+_NOTE_SECTIONS = (
+    ('main_finding', 'Main Finding'),
+    ('key_approach', 'Key Approach'),
+    ('key_results', 'Key Results'),
+    ('implication', 'Implication'),
+)
+_NOTE_DETAILS = (
+    ('study_type', 'Study Type'),
+    ('ecosystem', 'Ecosystem'),
+    ('analytical_methods', 'Methods'),
+    ('soil_fractions', 'Soil Fractions'),
+    ('soil_properties', 'Properties Measured'),
+    ('management', 'Management'),
+    ('depth_info', 'Sampling Depths'),
+)
+
+# Citation fields pushed by update_citation_metadata: argument -> Zotero field
+_CITATION_FIELDS = (
+    ('journal', 'publicationTitle'),
+    ('volume', 'volume'),
+    ('issue', 'issue'),
+    ('pages', 'pages'),
+)
+
+# Raised when Zotero refuses a request with 429 (names vary across pyzotero
+# versions); the request was not applied, so it is safe to send again
+_RATE_LIMIT_ERRORS = tuple(
+    getattr(zotero_errors, name)
+    for name in ('TooManyRequests', 'TooManyRequestsError', 'TooManyRetries', 'TooManyRetriesError')
+    if hasattr(zotero_errors, name)
+)
+_RATE_LIMIT_RETRIES = 3
+
+# Raised on 412: the item changed since the version we sent
+_CONFLICT_ERRORS = tuple(
+    getattr(zotero_errors, name)
+    for name in ('PreConditionFailed', 'PreConditionFailedError')
+    if hasattr(zotero_errors, name)
+)
+_CONFLICT_RETRIES = 3
+_DEFAULT_BACKOFF = 5.0  # seconds, when the server didn't send Backoff/Retry-After
+
+# Most objects the Zotero write API accepts per request
+_WRITE_BATCH_SIZE = 50
+
+# Largest page the Zotero read API returns; pages past the first are
+# fetched concurrently by at most _PAGE_WORKERS threads
+_PAGE_SIZE = 100
+_PAGE_WORKERS = 8
+
+
+def _file_md5(path: Path) -> str:
+    """MD5 of a file (Zotero's attachment checksum), read in blocks."""
+    digest = hashlib.md5(usedforsecurity=False)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_UPLOAD_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _UploadBody:
+    """
+    Request body of prefix + file contents + suffix, read block by block.
+
+    The storage upload wants these bytes as one POST. Serving them through
+    read() keeps only a block of the PDF in memory, and __len__ lets
+    requests send a Content-Length (the storage server refuses chunked
+    transfer encoding).
+    """
+
+    def __init__(self, prefix: bytes, path: Path, suffix: bytes):
+        pdf = open(path, 'rb')
+        self._parts = [io.BytesIO(prefix), pdf, io.BytesIO(suffix)]
+        self._length = len(prefix) + os.fstat(pdf.fileno()).st_size + len(suffix)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        while self._parts:
+            chunk = self._parts[0].read(size)
+            if chunk:
+                return chunk
+            self._parts.pop(0).close()
+        return b''
+
+    def close(self):
+        for part in self._parts:
+            part.close()
+        self._parts = []
+
+
+@functools.lru_cache(maxsize=None)
+def _web_client(user_id: str, library_type: str, api_key: str) -> zotero.Zotero:
+    """
+    Main-thread Web API client, one per library and key.
+
+    ZoteroSync instances for the same library share it, and with it its
+    pooled HTTP connections. Other threads use clients (and connections)
+    of their own, since pyzotero keeps per-call state on the client and
+    closes its HTTP client when collected; backoff is tracked per
+    ZoteroSync instead (see ZoteroSync._rate_limited).
+    """
+    return zotero.Zotero(user_id, library_type, api_key)
 
 
 class ZoteroSync:
     """Handles automatic synchronization with Zotero library."""
 
-    def __init__(self, api_key: str = None, user_id: str = None, library_type: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        user_id: str = None,
+        library_type: str = None,
+        cache_dir: Optional[Path] = None,
+        use_local_api: bool = True,
+    ):
         """
         Initialize Zotero client.
 
@@ -17,6 +175,10 @@ class ZoteroSync:
             api_key: Zotero API key (or from ZOTERO_API_KEY env var)
             user_id: Zotero user ID (or from ZOTERO_USER_ID env var)
             library_type: 'user' or 'group' (or from ZOTERO_LIBRARY_TYPE env var)
+            cache_dir: Where the DOI and collection indexes are kept between runs
+                (default ~/.cache/literature_manager)
+            use_local_api: Read the library through Zotero desktop's local API
+                when it is running (writes always use the Web API)
         """
         self.api_key = api_key or os.getenv('ZOTERO_API_KEY')
         self.user_id = user_id or os.getenv('ZOTERO_USER_ID')
@@ -28,12 +190,27 @@ class ZoteroSync:
                 "Set ZOTERO_API_KEY and ZOTERO_USER_ID in .env file or pass as arguments"
             )
 
-        # Initialize Zotero client
-        self.zot = zotero.Zotero(self.user_id, self.library_type, self.api_key)
-
-        # Cache collections and DOIs (populated on first use)
+        # Initialize Zotero client. pyzotero keeps per-call state on the
+        # client, so worker threads get their own (see the zot property)
+        self._zot = _web_client(self.user_id, self.library_type, self.api_key)
+        self._thread_clients = threading.local()
+        self._use_local_api = use_local_api
+        self._local_zot = None  # probed on first bulk read
+
+        # Cache collections and DOIs (populated on first use). upload_papers
+        # runs upload_paper on worker threads; the lock covers check-then-insert
+        self._lock = threading.Lock()
+        # Server-requested backoff (time.time() deadline) shared by all threads;
+        # a separate lock, as _lock is held across requests
+        self._backoff_lock = threading.Lock()
+        self._backoff_until = 0.0
         self._collections_cache = None
         self._doi_cache = None  # Maps DOI -> item key
+        self._title_cache = None  # Maps _norm_title(title) -> item key
+        self._cache_path = (cache_dir or _CACHE_DIR) / f"zotero_{self.library_type}_{self.user_id}.json"
+        self._collections_path = self._cache_path.with_name(
+            f"zotero_{self.library_type}_{self.user_id}_collections.json"
+        )
 
     def get_or_create_collection(self, topic_name: str) -> str:
         """
@@ -45,61 +222,328 @@ class ZoteroSync:
         Returns:
             Collection key
         """
-        # Load collections cache
-        if self._collections_cache is None:
-            self._collections_cache = {}
-            collections = self.zot.collections()
-            for coll in collections:
-                self._collections_cache[coll['data']['name']] = coll['key']
+        return self._ensure_collections([topic_name])[topic_name]
 
-        # Check if collection exists
-        if topic_name in self._collections_cache:
-            return self._collections_cache[topic_name]
+    def _ensure_collections(self, topics: List[str]) -> Dict[str, str]:
+        """
+        Resolve topics to collection keys, creating the missing ones together.
 
-        # Create new collection
-        new_coll = self.zot.create_collections([{
-            'name': topic_name,
-            'parentCollection': False
-        }])
+        The library's collections are loaded once per session (from the
+        versioned disk cache); topics not found there are created in a
+        single create_collections request.
 
-        coll_key = new_coll['successful']['0']['key']
-        self._collections_cache[topic_name] = coll_key
+        Args:
+            topics: Topic names
 
-        return coll_key
+        Returns:
+            Topic -> collection key (topics that couldn't be created are absent)
+        """
+        # Held across the create so two threads can't both create a topic
+        with self._lock:
+            # Load collections cache. Read through the Web API: the local
+            # API may not have synced collections we created yet
+            if self._collections_cache is None:
+                self._collections_cache = {
+                    name: key for key, name in self._sync_collections(self.zot).items()
+                }
+
+            missing = list(dict.fromkeys(t for t in topics if t not in self._collections_cache))
+            for start in range(0, len(missing), _WRITE_BATCH_SIZE):
+                batch = missing[start:start + _WRITE_BATCH_SIZE]
+                resp = self._rate_limited(self.zot.create_collections, [
+                    {'name': topic, 'parentCollection': False} for topic in batch
+                ])
+                for i, topic in enumerate(batch):
+                    success = resp['successful'].get(str(i))
+                    if success:
+                        self._collections_cache[topic] = success['key']
+                    else:
+                        logger.warning("  ⚠ Collection creation failed for %s: %s",
+                                       topic, resp['failed'].get(str(i), 'Unknown error'))
+
+            return {t: self._collections_cache[t] for t in topics if t in self._collections_cache}
+
+    def _rate_limited(self, call, *args, **kwargs):
+        """
+        Run a Zotero request, waiting out a 429 and retrying it.
+
+        Each thread has its own pyzotero client, which only records the
+        server's Backoff/Retry-After for itself. So the deadline is copied
+        to this instance, and every thread waits for it before sending.
+        """
+        client = getattr(call, '__self__', None) or self.zot
+        for attempt in range(_RATE_LIMIT_RETRIES):
+            self._wait_for_backoff()
+            try:
+                return call(*args, **kwargs)
+            except _RATE_LIMIT_ERRORS:
+                if attempt == _RATE_LIMIT_RETRIES - 1:
+                    raise
+                self._record_backoff(time.time() + _DEFAULT_BACKOFF)
+            finally:
+                # Backoff can also come with a successful response
+                self._record_backoff(getattr(client, 'backoff_until', 0.0))
+
+    def _wait_for_backoff(self):
+        """Sleep until the shared backoff deadline, if one is pending."""
+        with self._backoff_lock:
+            delay = self._backoff_until - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _record_backoff(self, until: float):
+        """Extend the shared backoff deadline to until (a time.time() value)."""
+        with self._backoff_lock:
+            self._backoff_until = max(self._backoff_until, until)
+
+    @property
+    def zot(self):
+        """Web API client for the calling thread."""
+        if threading.current_thread() is threading.main_thread():
+            return self._zot
+        client = getattr(self._thread_clients, 'zot', None)
+        if client is None:
+            self._bind_thread_client()
+            client = self._thread_clients.zot
+        return client
+
+    def _bind_thread_client(self):
+        """Give the calling worker thread its own Web API client."""
+        self._thread_clients.zot = self._new_client(local=False)
+
+    def _new_client(self, local: bool):
+        """A fresh Web API (or local API) client for this library."""
+        if local:
+            return zotero.Zotero(self.user_id, self.library_type, local=True)
+        return zotero.Zotero(self.user_id, self.library_type, self.api_key)
+
+    @property
+    def _read_zot(self):
+        """
+        Client for bulk, staleness-tolerant reads: the local API when available.
+
+        The desktop app answers over loopback with no rate limit, but only
+        sees our Web API writes after it syncs. So it only serves the cold
+        start's full-library scan, which is then caught up through the Web
+        API (see _sync_item_index); everything else stays on ``self.zot``.
+        """
+        if self._local_zot is None:
+            self._local_zot = self._probe_local_api() or False
+        return self._local_zot or self.zot
+
+    def _probe_local_api(self):
+        """Return a local-API client if Zotero desktop is serving it, else None."""
+        if not self._use_local_api:
+            return None
+        try:
+            response = requests.get(_LOCAL_API_URL, timeout=0.2)
+        except requests.RequestException:
+            return None
+        if response.status_code != 200 or response.headers.get('Zotero-API-Version') != '3':
+            return None
+        try:
+            return self._new_client(local=True)
+        except TypeError:
+            return None  # pyzotero too old to support local=True
 
     def _build_doi_cache(self):
-        """Build cache of all DOIs in the library for fast duplicate checking."""
-        if self._doi_cache is not None:
-            return
+        """Build caches of all DOIs and titles in the library for fast duplicate checking."""
+        with self._lock:
+            if self._doi_cache is None:
+                self._doi_cache, self._title_cache = self._load_doi_cache()
 
-        self._doi_cache = {}
+    def _load_doi_cache(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Return (DOI -> item key, title key -> item key) ({} if it can't be read)."""
         try:
-            # Fetch all items with DOI field (paginated)
-            start = 0
-            limit = 100
-            while True:
-                items = self.zot.items(start=start, limit=limit)
-                if not items:
-                    break
+            item_dois, item_titles = self._sync_item_index()
+        except Exception as e:
+            logger.warning("  Warning: Could not build DOI cache: %s", e)
+            return {}, {}
 
-                for item in items:
-                    doi = item['data'].get('DOI', '').strip().lower()
-                    if doi:
-                        # Normalize DOI (remove URL prefix if present)
-                        doi = doi.replace('https://doi.org/', '').replace('http://doi.org/', '')
-                        self._doi_cache[doi] = item['key']
+        return (
+            {doi: key for key, doi in item_dois.items()},
+            {title: key for key, title in item_titles.items()},
+        )
 
-                start += limit
-                if len(items) < limit:
-                    break
+    def _sync_item_index(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Return item key -> normalized DOI and item key -> normalized title
+        for the library's papers, using the disk cache.
+
+        The cache records the library version it reflects. When Zotero still
+        reports that version, nothing else is fetched; otherwise only items
+        changed since then (and deletions) are pulled, per the Zotero sync
+        protocol. Only a cold start pages through the whole library.
+
+        The version and the changes come from the Web API, which sees the
+        items earlier runs created even before the desktop app syncs them.
+        A cold-start scan through the local API is taken as of the version
+        the desktop app last synced, and caught up from there.
+        """
+        cached_version, (item_dois, item_titles) = self._load_versioned(
+            self._cache_path, ('dois', 'titles')
+        )
+
+        # Read the version first: anything modified while we fetch gets a
+        # newer version and is picked up on the next sync
+        library_version = self.zot.last_modified_version()
+        if cached_version == library_version:
+            return item_dois, item_titles
+
+        if cached_version is None:
+            cached_version, items = self._scan_items(library_version)
+            item_dois, item_titles = {}, {}
+            self._index_items(items, item_dois, item_titles)
+
+        if cached_version != library_version:
+            # Trashed items are included so they can be dropped from the maps
+            items = self._all_items(self.zot, since=cached_version, includeTrashed=1)
+            for key in self.zot.deleted(since=cached_version).get('items', []):
+                item_dois.pop(key, None)
+                item_titles.pop(key, None)
+            self._index_items(items, item_dois, item_titles)
+
+        self._save_versioned(
+            self._cache_path, library_version, dois=item_dois, titles=item_titles
+        )
+        return item_dois, item_titles
+
+    def _scan_items(self, library_version: int) -> Tuple[int, List[Dict]]:
+        """
+        Return (version, every item) for a cold start, preferring the local API.
 
-        except Exception as e:
-            print(f"  Warning: Could not build DOI cache: {e}")
-            self._doi_cache = {}
+        A local scan reflects the version the desktop app last synced, which
+        may trail the Web API's library_version.
+        """
+        zot = self._read_zot
+        if zot is not self.zot:
+            try:
+                local_version = zot.last_modified_version()
+                return min(local_version, library_version), self._all_items(zot)
+            except Exception:
+                pass  # Local API without an endpoint we need: use the Web API
+        return library_version, self._all_items(self.zot)
+
+    def _index_items(
+        self, items: List[Dict], item_dois: Dict[str, str], item_titles: Dict[str, str]
+    ):
+        """Apply fetched items to the key -> DOI and key -> title maps."""
+        for item in items:
+            key, data = item['key'], item['data']
+            item_dois.pop(key, None)
+            item_titles.pop(key, None)
+            if data.get('deleted') or data.get('itemType') in _CHILD_ITEM_TYPES:
+                continue
+            doi = self._norm_doi(data.get('DOI'))
+            if doi:
+                item_dois[key] = doi
+            title = self._norm_title(data.get('title'))
+            if title:
+                item_titles[key] = title
+
+    def _all_items(self, zot, **params) -> List[Dict]:
+        """
+        Fetch every item matching params, pages after the first in parallel.
+
+        The first page's Total-Results header gives the remaining offsets,
+        so those pages don't have to wait on each other. Each worker thread
+        uses its own client (pyzotero clients aren't thread-safe).
+        """
+        first = zot.items(start=0, limit=_PAGE_SIZE, **params)
+        total = zot.request.headers.get('Total-Results')
+        if total is None:
+            # Can't plan the offsets; follow the next links serially
+            return zot.everything(zot.items(limit=_PAGE_SIZE, **params))
+
+        offsets = range(_PAGE_SIZE, int(total), _PAGE_SIZE)
+        if not offsets:
+            return first
+
+        local = getattr(zot, 'local', False)
+        clients = threading.local()
+
+        def fetch(start: int) -> List[Dict]:
+            client = getattr(clients, 'zot', None)
+            if client is None:
+                client = clients.zot = self._new_client(local)
+            return self._rate_limited(client.items, start=start, limit=_PAGE_SIZE, **params)
+
+        with ThreadPoolExecutor(max_workers=min(_PAGE_WORKERS, len(offsets))) as pool:
+            pages = list(pool.map(fetch, offsets))
+        return first + [item for page in pages for item in page]
+
+    @staticmethod
+    def _norm_doi(doi: Optional[str]) -> str:
+        """Lowercase DOI without a doi.org URL prefix ('' for none)."""
+        return _DOI_PREFIX.sub('', doi.strip().lower()) if doi else ''
+
+    @staticmethod
+    def _norm_title(title: Optional[str]) -> str:
+        """Title lookup key: NFKD-folded, lowercase, punctuation runs as one space."""
+        if not title:
+            return ''
+        return _TITLE_SEPARATORS.sub(' ', unicodedata.normalize('NFKD', title).lower()).strip()
+
+    @staticmethod
+    def _load_versioned(
+        path: Path, fields: Tuple[str, ...]
+    ) -> Tuple[Optional[int], List[Dict[str, str]]]:
+        """
+        Return (library_version, one mapping per field) from a sync cache
+        file, or (None, empty mappings) if it is missing or incomplete.
+        """
+        try:
+            data = orjson.loads(path.read_bytes())
+            return int(data['version']), [dict(data[field]) for field in fields]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, [{} for _ in fields]
+
+    @staticmethod
+    def _save_versioned(path: Path, library_version: int, **mappings: Dict[str, str]):
+        """Write a sync cache file atomically; failures only cost a resync."""
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(orjson.dumps({'version': library_version, **mappings}))
+            temp_path.replace(path)
+        except OSError:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def _sync_collections(self, zot) -> Dict[str, str]:
+        """
+        Return collection key -> name for the library, using the disk cache.
+
+        Versioned like the DOI index: unchanged libraries cost one request,
+        otherwise only collections changed since the cached version (and
+        deletions) are fetched.
+        """
+        cached_version, (names,) = self._load_versioned(self._collections_path, ('collections',))
+
+        library_version = zot.last_modified_version()
+        if cached_version == library_version:
+            return names
+
+        if cached_version is None:
+            names = {}
+            collections = zot.everything(zot.collections())
+        else:
+            collections = zot.everything(zot.collections(since=cached_version))
+            for key in zot.deleted(since=cached_version).get('collections', []):
+                names.pop(key, None)
+
+        for coll in collections:
+            if coll['data'].get('deleted'):
+                names.pop(coll['key'], None)
+            else:
+                names[coll['key']] = coll['data']['name']
+
+        self._save_versioned(self._collections_path, library_version, collections=names)
+        return names
 
     def check_exists(self, doi: Optional[str] = None, title: Optional[str] = None) -> Optional[str]:
         """
-        Check if paper already exists in Zotero using DOI cache.
+        Check if paper already exists in Zotero using the DOI and title caches.
 
         Args:
             doi: Paper DOI
@@ -108,30 +552,17 @@ class ZoteroSync:
         Returns:
             Item key if exists, None otherwise
         """
-        # Build DOI cache on first use
-        self._build_doi_cache()
-
-        # Check DOI cache (fast, reliable)
-        if doi:
-            doi_normalized = doi.strip().lower()
-            doi_normalized = doi_normalized.replace('https://doi.org/', '').replace('http://doi.org/', '')
-            if doi_normalized in self._doi_cache:
-                return self._doi_cache[doi_normalized]
+        # Check DOI cache (fast, reliable); built on first use
+        doi_normalized = self._norm_doi(doi)
+        if doi_normalized:
+            self._build_doi_cache()
+            return self._doi_cache.get(doi_normalized)
 
-        # Fallback to title search only if no DOI
-        if title and not doi:
-            try:
-                # Search for exact title
-                results = self.zot.items(q=f'"{title}"', qmode='titleCreatorYear', limit=10)
-                if results:
-                    # Check if title actually matches (not just substring)
-                    title_lower = title.lower().strip()
-                    for item in results:
-                        item_title = item['data'].get('title', '')
-                        if item_title.lower().strip() == title_lower:
-                            return item['key']
-            except Exception:
-                pass
+        # Fallback to the title index only if no DOI
+        title_normalized = self._norm_title(title)
+        if title_normalized:
+            self._build_doi_cache()
+            return self._title_cache.get(title_normalized)
 
         return None
 
@@ -162,236 +593,466 @@ class ZoteroSync:
             existing_key = self.check_exists(doi, title)
 
             if existing_key:
-                if update_if_exists:
-                    # Update tags and collections
-                    self._update_item_tags_collections(existing_key, topics)
-                    print(f"  ℹ Updated existing Zotero item: {existing_key}")
-                else:
-                    print(f"  ℹ Paper already in Zotero, skipping")
+                self._handle_existing(existing_key, topics, update_if_exists)
                 return existing_key
 
-            # Create new item
-            template = self.zot.item_template('journalArticle')
-
-            # Basic metadata
-            template['title'] = title or ''
-            template['DOI'] = doi or ''
-            template['date'] = str(metadata.get('year', ''))
-            template['abstractNote'] = metadata.get('abstract') or ''
-
-            # Publication details (from CrossRef)
-            if metadata.get('journal'):
-                template['publicationTitle'] = metadata['journal']
-            if metadata.get('volume'):
-                template['volume'] = metadata['volume']
-            if metadata.get('issue'):
-                template['issue'] = metadata['issue']
-            if metadata.get('pages'):
-                template['pages'] = metadata['pages']
-            if metadata.get('issn'):
-                template['ISSN'] = metadata['issn']
-
-            # Authors
-            authors = metadata.get('authors', [])
-            template['creators'] = []
-            for author_str in authors:
-                # Parse "Last, First" or "First Last" format
-                if ',' in author_str:
-                    parts = author_str.split(',', 1)
-                    last = parts[0].strip()
-                    first = parts[1].strip() if len(parts) > 1 else ''
-                else:
-                    parts = author_str.strip().split()
-                    last = parts[-1] if parts else author_str
-                    first = ' '.join(parts[:-1]) if len(parts) > 1 else ''
-
-                template['creators'].append({
-                    'creatorType': 'author',
-                    'firstName': first,
-                    'lastName': last
-                })
-
-            # Tags from topics
-            template['tags'] = [{'tag': topic} for topic in topics]
-
-            # Add domain attributes to Extra field
-            extra_parts = []
-            summary = metadata.get('summary', '')
-            if summary:
-                extra_parts.append(f"Summary: {summary}")
-
-            domain = metadata.get('domain_attributes', {})
-            if domain.get('study_type'):
-                extra_parts.append(f"Study Type: {domain['study_type']}")
-            if domain.get('analytical_methods'):
-                extra_parts.append(f"Methods: {', '.join(domain['analytical_methods'])}")
-            if domain.get('soil_fractions'):
-                extra_parts.append(f"Fractions: {', '.join(domain['soil_fractions'])}")
-
-            if extra_parts:
-                template['extra'] = '\n'.join(extra_parts)
-
             # Create item
-            resp = self.zot.create_items([template])
+            resp = self._rate_limited(self.zot.create_items, [self._item_template(metadata, topics)])
 
             if resp['successful']:
                 item_key = resp['successful']['0']['key']
-                # Add to DOI cache for future duplicate checks
-                if doi:
-                    doi_normalized = doi.strip().lower()
-                    self._doi_cache[doi_normalized] = item_key
-                print(f"  ✓ Created Zotero item: {item_key}")
-
-                # Upload PDF
-                if pdf_path.exists():
-                    try:
-                        self.zot.attachment_simple([str(pdf_path)], item_key)
-                        print(f"  ✓ Uploaded PDF attachment")
-                    except Exception as e:
-                        print(f"  ⚠ PDF upload failed: {e}")
+                self._record_created(item_key, metadata)
 
                 # Add summary note if we have abstract
                 abstract = metadata.get('abstract')
                 if abstract:
                     self._add_summary_note(item_key, metadata)
 
-                # Add to collections (one per topic).
-                # Re-fetch the item before each add: the PDF attachment and
-                # summary note above already bumped the item's version, and
-                # each addto_collection bumps it again. Reusing a stale
-                # version triggers Zotero 412 "modified since" conflicts, so
-                # we pull the current version fresh on every iteration.
-                for topic in topics:
-                    try:
-                        coll_key = self.get_or_create_collection(topic)
-                        current_item = self.zot.item(item_key)
-                        self.zot.addto_collection(coll_key, current_item)
-                        print(f"  ✓ Added to collection: {topic}")
-                    except Exception as e:
-                        print(f"  ⚠ Collection add failed for {topic}: {e}")
-
+                self._attach_pdf(item_key, pdf_path)
                 return item_key
 
             else:
-                print(f"  ✗ Failed to create Zotero item: {resp.get('failed', 'Unknown error')}")
+                logger.error("  ✗ Failed to create Zotero item: %s", resp.get('failed', 'Unknown error'))
                 return None
 
         except Exception as e:
-            print(f"  ✗ Zotero upload error: {e}")
+            logger.error("  ✗ Zotero upload error: %s", e)
             return None
 
-    def _add_summary_note(self, parent_key: str, metadata: Dict):
+    def upload_papers(
+        self,
+        jobs: List[Tuple[Dict, Path, List[str]]],
+        update_if_exists: bool = True
+    ) -> List[Optional[str]]:
         """
-        Add an enhanced summary note to the Zotero item.
+        Upload several papers, batching the item and note creation.
 
-        Creates a note with main finding, key approach, implications,
-        and structured research details.
+        New items are created _WRITE_BATCH_SIZE per request, already in
+        their topic collections, then their summary notes likewise. The
+        per-item work that is left (PDF upload, updating papers already in
+        Zotero) overlaps across papers on a small thread pool; each paper's
+        own requests stay in order, since Zotero versions every write to an
+        item. Each worker sends through a pyzotero client of its own, bound
+        when the thread starts: clients keep per-call state (the last
+        response, URL params), so they can't be shared across threads.
+
+        Args:
+            jobs: (metadata, pdf_path, topics) per paper, as for upload_paper
+            update_if_exists: If True, update existing items with tags/collections
+
+        Returns:
+            Zotero item key (or None) per job, in job order
+        """
+        if not jobs:
+            return []
+
+        # Fill the DOI cache once up front rather than racing workers to it,
+        # and create every topic collection the batch needs in one request
+        self._build_doi_cache()
+        self._collection_keys([topic for _, _, topics in jobs for topic in topics])
+
+        keys: List[Optional[str]] = [None] * len(jobs)
+        existing = []   # job indexes already in Zotero
+        new = []        # job indexes to create
+        same_doi = {}   # job index -> earlier job index with the same DOI
+        first_with_doi = {}
+        for i, (metadata, _, _) in enumerate(jobs):
+            doi = metadata.get('doi')
+            keys[i] = self.check_exists(doi, metadata.get('title'))
+            if keys[i]:
+                existing.append(i)
+                continue
+            doi_normalized = self._norm_doi(doi)
+            if doi_normalized and doi_normalized in first_with_doi:
+                same_doi[i] = first_with_doi[doi_normalized]
+                continue
+            if doi_normalized:
+                first_with_doi[doi_normalized] = i
+            new.append(i)
+
+        # Create the new items, then notes for those with an abstract
+        created = []
+        for start in range(0, len(new), _WRITE_BATCH_SIZE):
+            batch = new[start:start + _WRITE_BATCH_SIZE]
+            templates = [self._item_template(jobs[i][0], jobs[i][2]) for i in batch]
+            for i, item_key in zip(batch, self._create_batch(templates, "item")):
+                if item_key:
+                    keys[i] = item_key
+                    self._record_created(item_key, jobs[i][0])
+                    created.append(i)
+
+        with_notes = [i for i in created if jobs[i][0].get('abstract')]
+        for start in range(0, len(with_notes), _WRITE_BATCH_SIZE):
+            batch = with_notes[start:start + _WRITE_BATCH_SIZE]
+            notes = [self._summary_note_template(keys[i], jobs[i][0]) for i in batch]
+            self._create_batch(notes, "summary note")
+
+        created_set = set(created)
+
+        def finish(i: int):
+            _, pdf_path, topics = jobs[i]
+            try:
+                if i in created_set:
+                    self._attach_pdf(keys[i], pdf_path)
+                else:
+                    self._handle_existing(keys[i], topics, update_if_exists)
+            except Exception as e:
+                logger.error("  ✗ Zotero upload error: %s", e)
+
+        remaining = created + existing
+        if remaining:
+            max_workers = min(8, len(remaining), (os.cpu_count() or 1) + 4)
+            with ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix='zotero-upload',
+                initializer=self._bind_thread_client,
+            ) as pool:
+                list(pool.map(finish, remaining))
+
+        for i, first in same_doi.items():
+            keys[i] = keys[first]
+
+        return keys
+
+    def _create_batch(self, templates: List[Dict], kind: str) -> List[Optional[str]]:
+        """
+        Create up to _WRITE_BATCH_SIZE objects in one request.
+
+        Returns:
+            New item key (or None if that object failed) per template
+        """
+        try:
+            resp = self._rate_limited(self.zot.create_items, templates)
+        except Exception as e:
+            logger.error("  ✗ Zotero %s creation error: %s", kind, e)
+            return [None] * len(templates)
+
+        keys = []
+        for i in range(len(templates)):
+            success = resp['successful'].get(str(i))
+            if success:
+                keys.append(success['key'])
+            else:
+                logger.error("  ✗ Failed to create Zotero %s: %s", kind, resp['failed'].get(str(i), 'Unknown error'))
+                keys.append(None)
+        return keys
+
+    def _new_template(self, item_type: str, link_mode: Optional[str] = None) -> Dict:
+        """
+        Fresh copy of the Zotero template for an item type.
+
+        pyzotero caches templates per client, but worker threads get
+        their own clients; the module-level cache fetches each type once.
+        """
+        key = (item_type, link_mode)
+        template = _ITEM_TEMPLATES.get(key)
+        if template is None:
+            template = _ITEM_TEMPLATES.setdefault(key, self.zot.item_template(item_type, link_mode))
+        return copy.deepcopy(template)
+
+    def _item_template(self, metadata: Dict, topics: List[str]) -> Dict:
+        """Build the journalArticle item for a paper."""
+        doi = metadata.get('doi')
+        title = metadata.get('title')
+
+        template = self._new_template('journalArticle')
+
+        # Basic metadata
+        template['title'] = title or ''
+        template['DOI'] = doi or ''
+        template['date'] = str(metadata.get('year', ''))
+        template['abstractNote'] = metadata.get('abstract') or ''
+
+        # Publication details (from CrossRef)
+        if metadata.get('journal'):
+            template['publicationTitle'] = metadata['journal']
+        if metadata.get('volume'):
+            template['volume'] = metadata['volume']
+        if metadata.get('issue'):
+            template['issue'] = metadata['issue']
+        if metadata.get('pages'):
+            template['pages'] = metadata['pages']
+        if metadata.get('issn'):
+            template['ISSN'] = metadata['issn']
+
+        # Authors
+        authors = metadata.get('authors', [])
+        template['creators'] = []
+        for author_str in authors:
+            # Parse "Last, First" or "First Last" format
+            if ',' in author_str:
+                parts = author_str.split(',', 1)
+                last = parts[0].strip()
+                first = parts[1].strip() if len(parts) > 1 else ''
+            else:
+                parts = author_str.strip().split()
+                last = parts[-1] if parts else author_str
+                first = ' '.join(parts[:-1]) if len(parts) > 1 else ''
+
+            template['creators'].append({
+                'creatorType': 'author',
+                'firstName': first,
+                'lastName': last
+            })
+
+        # Tags and collections from topics; membership is part of the item,
+        # so it's set here rather than with an addto_collection per topic
+        template['tags'] = [{'tag': topic} for topic in topics]
+        template['collections'] = self._collection_keys(topics)
+
+        # Add domain attributes to Extra field
+        extra_parts = []
+        summary = metadata.get('summary', '')
+        if summary:
+            extra_parts.append(f"Summary: {summary}")
+
+        domain = metadata.get('domain_attributes', {})
+        if domain.get('study_type'):
+            extra_parts.append(f"Study Type: {domain['study_type']}")
+        if domain.get('analytical_methods'):
+            extra_parts.append(f"Methods: {', '.join(domain['analytical_methods'])}")
+        if domain.get('soil_fractions'):
+            extra_parts.append(f"Fractions: {', '.join(domain['soil_fractions'])}")
+
+        if extra_parts:
+            template['extra'] = '\n'.join(extra_parts)
+
+        return template
+
+    def _record_created(self, item_key: str, metadata: Dict):
+        """Add a new item to the DOI/title caches for future duplicate checks."""
+        doi_normalized = self._norm_doi(metadata.get('doi'))
+        title_normalized = self._norm_title(metadata.get('title'))
+        with self._lock:
+            if self._doi_cache is not None:
+                if doi_normalized:
+                    self._doi_cache[doi_normalized] = item_key
+                if title_normalized:
+                    self._title_cache[title_normalized] = item_key
+        logger.info("  ✓ Created Zotero item: %s", item_key)
+
+    def _handle_existing(self, item_key: str, topics: List[str], update_if_exists: bool):
+        """Report a paper already in Zotero, updating its tags/collections if asked."""
+        if update_if_exists:
+            # Update tags and collections
+            self._update_item_tags_collections(item_key, topics)
+            logger.info("  ℹ Updated existing Zotero item: %s", item_key)
+        else:
+            logger.info("  ℹ Paper already in Zotero, skipping")
+
+    def _attach_pdf(self, item_key: str, pdf_path: Path):
+        """Upload the PDF for a new item."""
+        if pdf_path.exists():
+            try:
+                self._upload_pdf(item_key, pdf_path)
+                logger.info("  ✓ Uploaded PDF attachment")
+            except Exception as e:
+                logger.warning("  ⚠ PDF upload failed: %s", e)
+
+    def _upload_pdf(self, parent_key: str, pdf_path: Path) -> str:
+        """
+        Attach a PDF to an item via the Zotero file upload protocol.
+
+        Creates the attachment item, asks for upload authorization, streams
+        the file to storage and registers the upload. pyzotero's
+        attachment_simple reads the whole file into memory for a multipart
+        POST; here the PDF is only ever read block by block.
+
+        Returns:
+            Attachment item key
         """
+        attachment = self._new_template('attachment', 'imported_file')
+        attachment.update({
+            'title': pdf_path.name,
+            'filename': pdf_path.name,
+            'contentType': 'application/pdf',
+            'parentItem': parent_key,
+        })
+        resp = self._rate_limited(self.zot.create_items, [attachment])
+        if not resp['successful']:
+            raise RuntimeError(f"attachment item not created: {resp.get('failed', 'Unknown error')}")
+        attachment_key = resp['successful']['0']['key']
+
+        stat = pdf_path.stat()
+        auth = self._file_request(attachment_key, {
+            'md5': _file_md5(pdf_path),
+            'filename': pdf_path.name,
+            'filesize': stat.st_size,
+            'mtime': int(stat.st_mtime * 1000),
+        }).json()
+
+        # Storage already has a file with this checksum: nothing to send
+        if auth.get('exists'):
+            return attachment_key
+
+        body = _UploadBody(auth['prefix'].encode(), pdf_path, auth['suffix'].encode())
+        try:
+            upload = requests.post(
+                auth['url'],
+                data=body,
+                headers={'Content-Type': auth['contentType']},
+                timeout=_UPLOAD_TIMEOUT,
+            )
+        finally:
+            body.close()
+        upload.raise_for_status()
+
+        self._file_request(attachment_key, {'upload': auth['uploadKey']})
+        return attachment_key
+
+    def _file_request(self, attachment_key: str, form: Dict) -> requests.Response:
+        """POST to an attachment's /file endpoint (new file), waiting out 429s."""
+        url = f"{_WEB_API_URL}/{self.library_type}s/{self.user_id}/items/{attachment_key}/file"
+        headers = {
+            'Zotero-API-Key': self.api_key,
+            'Zotero-API-Version': '3',
+            'If-None-Match': '*',
+        }
+        for attempt in range(_RATE_LIMIT_RETRIES):
+            self._wait_for_backoff()
+            response = requests.post(url, data=form, headers=headers, timeout=_UPLOAD_TIMEOUT)
+            if response.status_code != 429 or attempt == _RATE_LIMIT_RETRIES - 1:
+                break
+            delay = response.headers.get('Retry-After') or response.headers.get('Backoff')
+            self._record_backoff(time.time() + (float(delay) if delay else _DEFAULT_BACKOFF))
+        response.raise_for_status()
+        return response
+
+    def _collection_keys(self, topics: List[str]) -> List[str]:
+        """Collection keys for topics, creating missing collections."""
+        try:
+            collections = self._ensure_collections(topics)
+        except Exception as e:
+            logger.warning("  ⚠ Collection lookup failed: %s", e)
+            return []
+        return [collections[topic] for topic in topics if topic in collections]
+
+    def _add_summary_note(self, parent_key: str, metadata: Dict):
+        """Add an enhanced summary note to the Zotero item."""
         try:
-            # Build note content
-            enhanced = metadata.get('enhanced_summary', {})
-            domain = metadata.get('domain_attributes', {})
-            short_summary = metadata.get('summary', '')
-
-            note_parts = ["<h2>📋 Paper Summary</h2>"]
-
-            # Enhanced summary (main finding, approach, implication)
-            if enhanced:
-                if enhanced.get('main_finding'):
-                    note_parts.append(f"<h3>Main Finding</h3>")
-                    note_parts.append(f"<p>{enhanced['main_finding']}</p>")
-
-                if enhanced.get('key_approach'):
-                    note_parts.append(f"<h3>Key Approach</h3>")
-                    note_parts.append(f"<p>{enhanced['key_approach']}</p>")
-
-                if enhanced.get('implication'):
-                    note_parts.append(f"<h3>Implication</h3>")
-                    note_parts.append(f"<p>{enhanced['implication']}</p>")
-            elif short_summary:
-                # Fallback to short summary if no enhanced summary
-                note_parts.append(f"<p><strong>Key Finding:</strong> {short_summary}</p>")
-
-            # Domain attributes section
-            if domain and any(domain.values()):
-                note_parts.append("<h3>Research Details</h3>")
-                note_parts.append("<ul>")
-
-                if domain.get('study_type'):
-                    note_parts.append(f"<li><strong>Study Type:</strong> {domain['study_type']}</li>")
-                if domain.get('ecosystem'):
-                    note_parts.append(f"<li><strong>Ecosystem:</strong> {domain['ecosystem']}</li>")
-                if domain.get('analytical_methods'):
-                    methods = ', '.join(domain['analytical_methods'])
-                    note_parts.append(f"<li><strong>Methods:</strong> {methods}</li>")
-                if domain.get('soil_fractions'):
-                    fractions = ', '.join(domain['soil_fractions'])
-                    note_parts.append(f"<li><strong>Soil Fractions:</strong> {fractions}</li>")
-                if domain.get('soil_properties'):
-                    props = ', '.join(domain['soil_properties'])
-                    note_parts.append(f"<li><strong>Properties Measured:</strong> {props}</li>")
-                if domain.get('management'):
-                    mgmt = ', '.join(domain['management'])
-                    note_parts.append(f"<li><strong>Management:</strong> {mgmt}</li>")
-                if domain.get('depth_info'):
-                    depths = ', '.join(domain['depth_info']) if isinstance(domain['depth_info'], list) else str(domain['depth_info'])
-                    note_parts.append(f"<li><strong>Sampling Depths:</strong> {depths}</li>")
-
-                note_parts.append("</ul>")
-
-            note_parts.append("<hr><p><em>Generated by Literature Manager</em></p>")
-
-            note_content = '\n'.join(note_parts)
-
-            # Create note
-            note_template = self.zot.item_template('note')
-            note_template['note'] = note_content
-            note_template['parentItem'] = parent_key
-
-            resp = self.zot.create_items([note_template])
+            note_template = self._summary_note_template(parent_key, metadata)
+            resp = self._rate_limited(self.zot.create_items, [note_template])
 
             if resp['successful']:
-                print(f"  ✓ Added summary note")
+                logger.info("  ✓ Added summary note")
             else:
-                print(f"  ⚠ Note creation failed")
+                logger.warning("  ⚠ Note creation failed")
 
         except Exception as e:
-            print(f"  ⚠ Note creation error: {e}")
+            logger.warning("  ⚠ Note creation error: %s", e)
 
-    def _update_item_tags_collections(self, item_key: str, topics: List[str]):
-        """Update tags and collections for existing item.
+    def _summary_note_template(self, parent_key: str, metadata: Dict) -> Dict:
+        """
+        Build the enhanced summary note for a Zotero item.
+
+        The note has main finding, key approach, implications,
+        and structured research details.
+        """
+        note_content = self._render_summary_note(
+            metadata.get('enhanced_summary', {}),
+            details=metadata.get('domain_attributes', {}),
+            key_finding=metadata.get('summary', ''),
+        )
+
+        note_template = self._new_template('note')
+        note_template['note'] = note_content
+        note_template['parentItem'] = parent_key
+        return note_template
+
+    @staticmethod
+    def _render_summary_note(
+        sections: Dict,
+        details: Optional[Dict] = None,
+        key_finding: str = '',
+        footer: str = "Generated by Literature Manager",
+    ) -> str:
+        """
+        Render summary note HTML, escaping all summary text.
 
-        Each write (update_item, addto_collection) bumps the item's Zotero
-        version, so we re-fetch the item before every write. Reusing a stale
-        version across consecutive PATCHes triggers 412 "modified since"
-        conflicts.
+        Args:
+            sections: Summary dict (main_finding, key_approach, key_results, implication)
+            details: Domain attributes listed under Research Details
+            key_finding: One-line summary shown when sections is empty
+            footer: Attribution line at the bottom of the note
         """
+        parts = [_NOTE_HEADER]
+
+        if sections:
+            for field, label in _NOTE_SECTIONS:
+                if sections.get(field):
+                    parts.append(f"<h3>{label}</h3><p>{html.escape(str(sections[field]))}</p>")
+        elif key_finding:
+            # Fallback to short summary if no enhanced summary
+            parts.append(f"<p><strong>Key Finding:</strong> {html.escape(key_finding)}</p>")
+
+        if details and any(details.values()):
+            parts.append("<h3>Research Details</h3><ul>")
+            for field, label in _NOTE_DETAILS:
+                value = details.get(field)
+                if value:
+                    text = ', '.join(value) if isinstance(value, list) else str(value)
+                    parts.append(f"<li><strong>{label}:</strong> {html.escape(text)}</li>")
+            parts.append("</ul>")
+
+        parts.append(f"<hr><p><em>{footer}</em></p>")
+        return ''.join(parts)
+
+    def _update_item_tags_collections(self, item_key: str, topics: List[str]):
+        """Update tags and collections for existing item in a single write."""
         try:
-            # Get current item
-            item = self.zot.item(item_key)
+            collection_keys = self._collection_keys(topics)
 
-            # Add topic tags (preserve existing tags)
-            current_tags = item['data'].get('tags', [])
-            current_tag_names = {tag['tag'] for tag in current_tags}
+            def add_topics(data: Dict) -> bool:
+                # Add topic tags (preserve existing tags)
+                current_tags = data.get('tags', [])
+                current_tag_names = {tag['tag'] for tag in current_tags}
 
-            new_tags = current_tags.copy()
-            for topic in topics:
-                if topic not in current_tag_names:
-                    new_tags.append({'tag': topic})
+                new_tags = current_tags.copy()
+                for topic in topics:
+                    if topic not in current_tag_names:
+                        new_tags.append({'tag': topic})
+
+                # Add topic collections (preserve existing membership)
+                current_collections = data.get('collections', [])
+                new_collections = current_collections + [
+                    key for key in collection_keys if key not in current_collections
+                ]
 
-            # Update item with new tags
-            item['data']['tags'] = new_tags
-            self.zot.update_item(item)
+                if len(new_tags) == len(current_tags) and new_collections == current_collections:
+                    return False
+
+                data['tags'] = new_tags
+                data['collections'] = new_collections
+                return True
 
-            # Add to collections — re-fetch before each add so the version is
-            # current (the update_item above and each prior add bumped it).
-            for topic in topics:
-                coll_key = self.get_or_create_collection(topic)
-                current_item = self.zot.item(item_key)
-                self.zot.addto_collection(coll_key, current_item)
+            self._update_item(self.zot.item(item_key), add_topics)
 
         except Exception as e:
-            print(f"  ⚠ Error updating item: {e}")
+            logger.warning("  ⚠ Error updating item: %s", e)
+
+    def _update_item(self, item: Dict, edit: Callable[[Dict], bool]) -> bool:
+        """
+        Apply edit to an item's data and save it if edit reports a change.
+
+        The write is conditional on the version the item was read at
+        (If-Unmodified-Since-Version), so nothing is re-fetched up front;
+        only on a 412, when the item changed in between, is it re-read and
+        the edit re-applied.
+
+        Returns:
+            True if the item was updated, False if edit left it unchanged
+        """
+        for attempt in range(_CONFLICT_RETRIES):
+            if not edit(item['data']):
+                return False
+            try:
+                self._rate_limited(self.zot.update_item, item)
+                return True
+            except _CONFLICT_ERRORS:
+                if attempt == _CONFLICT_RETRIES - 1:
+                    raise
+                item = self.zot.item(item['key'])
+        return False
 
     def update_citation_metadata(
         self,
@@ -414,46 +1075,141 @@ class ZoteroSync:
         Returns:
             True if updated successfully, False otherwise
         """
+        # Nothing to push: skip the DOI cache and the item fetch entirely
+        values = self._citation_values(
+            {'journal': journal, 'volume': volume, 'issue': issue, 'pages': pages}
+        )
+        if not values:
+            return False
+
         try:
             # Find item by DOI
+            doi_normalized = self._norm_doi(doi)
+            if not doi_normalized:
+                return False
             self._build_doi_cache()
-            doi_normalized = doi.strip().lower()
-            doi_normalized = doi_normalized.replace('https://doi.org/', '').replace('http://doi.org/', '')
 
             item_key = self._doi_cache.get(doi_normalized)
             if not item_key:
                 return False
 
-            # Get current item
-            item = self.zot.item(item_key)
+            return self._update_item(
+                self.zot.item(item_key), lambda data: self._fill_empty_fields(data, values)
+            )
+
+        except Exception as e:
+            logger.warning("  ⚠ Error updating citation: %s", e)
+            return False
 
-            # Track if we made changes
-            changed = False
+    def update_citation_metadata_batch(self, updates: List[Dict]) -> List[Optional[bool]]:
+        """
+        Update citation metadata for many items with batched requests.
 
-            # Only update empty fields
-            if journal and not item['data'].get('publicationTitle'):
-                item['data']['publicationTitle'] = journal
-                changed = True
-            if volume and not item['data'].get('volume'):
-                item['data']['volume'] = volume
-                changed = True
-            if issue and not item['data'].get('issue'):
-                item['data']['issue'] = issue
-                changed = True
-            if pages and not item['data'].get('pages'):
-                item['data']['pages'] = pages
-                changed = True
+        Items are fetched _WRITE_BATCH_SIZE at a time by key and the changed
+        ones written back in one update_items call per batch; an item the
+        server rejects (e.g. changed since it was read), or every item of a
+        batch whose request failed, is retried on its own.
 
-            if changed:
-                self.zot.update_item(item)
-                return True
+        Args:
+            updates: Dicts with doi and any of journal, volume, issue, pages
 
-            return False
+        Returns:
+            Per update: True if updated, False if nothing needed changing,
+            None if the DOI isn't in Zotero
+        """
+        results: List[Optional[bool]] = [None] * len(updates)
+        wanted = []  # (update index, item key, Zotero field -> value)
+        for i, update in enumerate(updates):
+            values = self._citation_values(update)
+            if not values:
+                results[i] = False
+                continue
+            doi_normalized = self._norm_doi(update.get('doi'))
+            if not doi_normalized:
+                continue
+            self._build_doi_cache()
+            item_key = self._doi_cache.get(doi_normalized)
+            if item_key:
+                wanted.append((i, item_key, values))
+
+        for start in range(0, len(wanted), _WRITE_BATCH_SIZE):
+            batch = wanted[start:start + _WRITE_BATCH_SIZE]
+            fetched = self._rate_limited(
+                self.zot.items,
+                itemKey=','.join(item_key for _, item_key, _ in batch),
+                limit=_WRITE_BATCH_SIZE,
+            )
+            items = {item['key']: item for item in fetched}
+
+            changed = []  # (update index, item, Zotero field -> value set on it)
+            for i, item_key, values in batch:
+                item = items.get(item_key)
+                if item is None:
+                    continue  # deleted since the DOI index was synced
+                filled = {
+                    field: value for field, value in values.items() if not item['data'].get(field)
+                }
+                if filled:
+                    self._fill_empty_fields(item['data'], filled)
+                    changed.append((i, item, filled))
+                else:
+                    results[i] = False
+            if not changed:
+                continue
 
+            try:
+                self._rate_limited(self.zot.update_items, [item for _, item, _ in changed])
+                failed = self.zot.request.json().get('failed') or {}
+            except Exception as e:
+                # The server may have applied some of the batch; sort it out per item
+                logger.warning("  ⚠ Citation batch update failed, retrying items singly: %s", e)
+                failed = None
+            for n, (i, item, filled) in enumerate(changed):
+                if failed is not None and str(n) not in failed:
+                    results[i] = True
+                else:
+                    results[i] = self._retry_citation_update(item['key'], filled)
+
+        return results
+
+    def _retry_citation_update(self, item_key: str, filled: Dict[str, str]) -> bool:
+        """
+        Write one item's citation fields on its own after its batch write failed.
+
+        The item is re-read first, so fields the batch did get applied are
+        not sent again.
+
+        Returns:
+            True if the fields were written (now or by the failed batch)
+        """
+        try:
+            item = self.zot.item(item_key)
+            if all(item['data'].get(field) == value for field, value in filled.items()):
+                return True
+            return self._update_item(item, lambda data: self._fill_empty_fields(data, filled))
         except Exception as e:
-            print(f"  ⚠ Error updating citation: {e}")
+            logger.warning("  ⚠ Error updating citation: %s", e)
             return False
 
+    @staticmethod
+    def _citation_values(fields: Dict) -> Dict[str, str]:
+        """Zotero field -> value for the citation fields that have a value."""
+        return {
+            zotero_field: fields[name]
+            for name, zotero_field in _CITATION_FIELDS
+            if fields.get(name)
+        }
+
+    @staticmethod
+    def _fill_empty_fields(data: Dict, values: Dict[str, str]) -> bool:
+        """Set values on item data where the field is empty; True if any was set."""
+        changed = False
+        for field, value in values.items():
+            if not data.get(field):
+                data[field] = value
+                changed = True
+        return changed
+
     def add_or_update_fulltext_note(
         self,
         doi: str,
@@ -473,57 +1229,42 @@ class ZoteroSync:
         """
         try:
             # Find item by DOI
+            doi_normalized = self._norm_doi(doi)
+            if not doi_normalized:
+                return False
             self._build_doi_cache()
-            doi_normalized = doi.strip().lower()
-            doi_normalized = doi_normalized.replace('https://doi.org/', '').replace('http://doi.org/', '')
 
             item_key = self._doi_cache.get(doi_normalized)
             if not item_key:
                 return False
 
             # Check for existing summary note
-            children = self.zot.children(item_key)
-            existing_note_key = None
+            # Only notes are listed (not attachments), newest first
+            children = self.zot.children(
+                item_key, itemType='note', sort='dateModified', direction='desc'
+            )
+            existing_note = None
 
             for child in children:
-                if child['data'].get('itemType') == 'note':
-                    note_content = child['data'].get('note', '')
-                    if 'Paper Summary' in note_content or 'Main Finding' in note_content:
-                        existing_note_key = child['key']
-                        break
-
-            # Build note HTML
-            note_parts = ["<h2>📋 Paper Summary</h2>"]
-
-            if fulltext_summary.get('main_finding'):
-                note_parts.append("<h3>Main Finding</h3>")
-                note_parts.append(f"<p>{fulltext_summary['main_finding']}</p>")
-
-            if fulltext_summary.get('key_approach'):
-                note_parts.append("<h3>Key Approach</h3>")
-                note_parts.append(f"<p>{fulltext_summary['key_approach']}</p>")
-
-            if fulltext_summary.get('key_results'):
-                note_parts.append("<h3>Key Results</h3>")
-                note_parts.append(f"<p>{fulltext_summary['key_results']}</p>")
-
-            if fulltext_summary.get('implication'):
-                note_parts.append("<h3>Implication</h3>")
-                note_parts.append(f"<p>{fulltext_summary['implication']}</p>")
+                note_content = child['data'].get('note', '')
+                if 'Paper Summary' in note_content or 'Main Finding' in note_content:
+                    existing_note = child
+                    break
 
-            note_parts.append("<hr><p><em>Generated by Literature Manager (fulltext)</em></p>")
+            note_content = self._render_summary_note(
+                fulltext_summary, footer="Generated by Literature Manager (fulltext)"
+            )
 
-            note_content = '\n'.join(note_parts)
+            if existing_note:
+                # Update existing note; the child listing carries its version
+                def set_note(data: Dict) -> bool:
+                    data['note'] = note_content
+                    return True
 
-            if existing_note_key:
-                # Update existing note
-                note_item = self.zot.item(existing_note_key)
-                note_item['data']['note'] = note_content
-                self.zot.update_item(note_item)
-                return True
+                return self._update_item(existing_note, set_note)
             else:
                 # Create new note
-                note_template = self.zot.item_template('note')
+                note_template = self._new_template('note')
                 note_template['note'] = note_content
                 note_template['parentItem'] = item_key
 
@@ -535,5 +1276,5 @@ class ZoteroSync:
                     return False
 
         except Exception as e:
-            print(f"  ⚠ Error adding fulltext note: {e}")
+            logger.warning("  ⚠ Error adding fulltext note: %s", e)
             return False
@@ -0,0 +1,144 @@
+"""Tests for the index journal: appends, replay, compaction and merging."""
+
+import threading
+
+import orjson
+import pytest
+
+from literature_manager import operations
+from literature_manager.operations import (
+    append_index_entry,
+    index_write_lock,
+    load_index,
+    save_index,
+    update_index_entries,
+)
+
+
+def _entry(file_hash, **fields):
+    return {"file_hash": file_hash, "title": f"Paper {file_hash}", **fields}
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    path = tmp_path / ".index.json"
+    with index_write_lock(path):
+        save_index({"a": _entry("a"), "b": _entry("b")}, path)
+    return path
+
+
+def _journal(index_path):
+    return index_path.with_suffix(".journal")
+
+
+def test_append_is_journaled_and_replayed(index_path):
+    with index_write_lock(index_path):
+        append_index_entry(_entry("c"), index_path)
+
+    assert _journal(index_path).exists()
+    assert "c" not in orjson.loads(index_path.read_bytes())
+    assert set(load_index(index_path)) == {"a", "b", "c"}
+
+
+def test_torn_line_is_skipped_and_not_glued_to_next_append(index_path):
+    with index_write_lock(index_path):
+        append_index_entry(_entry("c"), index_path)
+        # A crash mid-append leaves a line without its newline
+        with open(_journal(index_path), "ab") as f:
+            f.write(b'{"file_hash": "torn", "tit')
+
+        assert set(load_index(index_path)) == {"a", "b", "c"}
+
+        append_index_entry(_entry("d"), index_path)
+
+    assert set(load_index(index_path)) == {"a", "b", "c", "d"}
+
+
+def test_save_under_lock_replays_appends_made_after_the_load(index_path):
+    with index_write_lock(index_path):
+        index = load_index(index_path)
+        append_index_entry(_entry("a", title="Newer"), index_path)
+        append_index_entry(_entry("c"), index_path)
+        save_index(index, index_path)
+
+    assert not _journal(index_path).exists()
+    index = load_index(index_path)
+    assert set(index) == {"a", "b", "c"}
+    assert index["a"]["title"] == "Newer"
+
+
+def test_save_of_index_read_without_lock_only_adds_missing_entries(index_path):
+    index = load_index(index_path)
+    index["a"]["title"] = "Caller's edit"
+
+    with index_write_lock(index_path):
+        append_index_entry(_entry("a", title="Journaled"), index_path)
+        append_index_entry(_entry("c"), index_path)
+
+    with index_write_lock(index_path):
+        save_index(index, index_path)
+
+    index = load_index(index_path)
+    assert set(index) == {"a", "b", "c"}
+    assert index["a"]["title"] == "Caller's edit"
+
+
+def test_journal_is_compacted_at_size_threshold(index_path, monkeypatch):
+    monkeypatch.setattr(operations, "_JOURNAL_COMPACT_BYTES", 0)
+    threshold = index_path.stat().st_size // 2
+    line_size = len(orjson.dumps(_entry("x0")) + b"\n")
+
+    with index_write_lock(index_path):
+        appended = 0
+        while (appended + 1) * line_size < threshold:
+            append_index_entry(_entry(f"x{appended}"), index_path)
+            appended += 1
+        assert _journal(index_path).exists()
+
+        append_index_entry(_entry(f"x{appended}"), index_path)
+
+    assert not _journal(index_path).exists()
+    snapshot = orjson.loads(index_path.read_bytes())
+    assert {f"x{i}" for i in range(appended + 1)} <= set(snapshot)
+
+
+def test_save_index_requires_lock(index_path):
+    with pytest.raises(RuntimeError):
+        save_index({}, index_path)
+
+
+def test_nested_lock_raises_instead_of_blocking(index_path):
+    with index_write_lock(index_path):
+        with pytest.raises(RuntimeError):
+            with index_write_lock(index_path):
+                pass
+
+
+def test_update_index_entries_keeps_concurrent_additions(index_path):
+    index = load_index(index_path)
+
+    # The watcher files a paper and another command drops one while this
+    # command works on its copy
+    def concurrent_writer():
+        with index_write_lock(index_path):
+            append_index_entry(_entry("c"), index_path)
+            current = load_index(index_path)
+            del current["b"]
+            save_index(current, index_path)
+
+    writer = threading.Thread(target=concurrent_writer)
+    writer.start()
+    writer.join()
+
+    index["a"]["title"] = "Updated"
+    update_index_entries(index_path, {"a": index["a"], "b": index["b"]})
+
+    index = load_index(index_path)
+    assert set(index) == {"a", "c"}
+    assert index["a"]["title"] == "Updated"
+
+
+def test_update_index_entries_removes_entries(index_path):
+    update_index_entries(index_path, {}, removed=["b"])
+
+    assert set(load_index(index_path)) == {"a"}
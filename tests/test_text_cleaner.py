@@ -0,0 +1,55 @@
+"""Tests for publisher boilerplate removal."""
+
+from literature_manager.extractors.text_cleaner import PAGE_BREAK, clean_boilerplate
+
+
+def _pages(text):
+    return [page.split("\n") for page in text.split(PAGE_BREAK)]
+
+
+def test_running_header_with_page_numbers_kept_once():
+    text = PAGE_BREAK.join([
+        "Soil Biol. Biochem. 12 (2024) 101\nIntroduction",
+        "Soil Biol. Biochem. 12 (2024) 102\nMethods",
+        "103 Soil Biol. Biochem. 12 (2024)\nResults",
+    ])
+
+    assert _pages(clean_boilerplate(text)) == [
+        ["Soil Biol. Biochem. 12 (2024) 101", "Introduction"],
+        ["Methods"],
+        ["Results"],
+    ]
+
+
+def test_repeated_numeric_content_is_kept():
+    row = "0.52 1.21 3.40"
+    text = PAGE_BREAK.join([f"Table 1\n{row}", f"Table 2\n{row}", f"Table 3\n{row}"])
+
+    assert _pages(clean_boilerplate(text)) == [
+        ["Table 1", row],
+        ["Table 2", row],
+        ["Table 3", row],
+    ]
+
+
+def test_lines_differing_in_inner_numbers_are_not_folded():
+    text = PAGE_BREAK.join([
+        "Carbon stocks fell 12 percent in plots\nA",
+        "Carbon stocks fell 30 percent in plots\nB",
+    ])
+
+    assert _pages(clean_boilerplate(text)) == [
+        ["Carbon stocks fell 12 percent in plots", "A"],
+        ["Carbon stocks fell 30 percent in plots", "B"],
+    ]
+
+
+def test_publisher_noise_removed():
+    text = (
+        "Downloaded from academic.oup.com by guest on 3 May 2024\n"
+        "Abstract text\n"
+        "© 2023 Elsevier B.V. All rights reserved.\n"
+        "See https://doi.org/10.1016/j.soilbio.2024.1 Page 2 of 10"
+    )
+
+    assert clean_boilerplate(text) == "Abstract text\nSee"
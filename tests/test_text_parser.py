@@ -0,0 +1,119 @@
+"""Tests for PDF text extraction: isolated readers, the text cache and prefetch."""
+
+from collections import OrderedDict
+
+import pytest
+
+from literature_manager.extractors import text_parser
+from literature_manager.extractors.exceptions import CorruptedPDFError
+from literature_manager.extractors.text_parser import extract_text_from_pdf, prefetch_pdf_text
+
+
+def _make_pdf(pages):
+    """Minimal PDF with one line of Helvetica text per page."""
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(len(pages)))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {5 + 2 * i} 0 R "
+            "/Resources << /Font << /F1 3 0 R >> >> >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(out)
+
+
+@pytest.fixture(autouse=True)
+def empty_text_cache(monkeypatch):
+    monkeypatch.setattr(text_parser, "_text_cache", OrderedDict())
+
+
+@pytest.fixture
+def counted_reads(monkeypatch):
+    """Replace the readers with a stub that records each read."""
+    reads = []
+
+    def read(pdf_path, max_pages=3, max_chars=None):
+        reads.append((pdf_path.name, max_chars))
+        return True, "x" * 100
+
+    monkeypatch.setattr(text_parser, "_read_pdf_text", read)
+    return reads
+
+
+def test_extracts_text_in_isolated_reader(tmp_path):
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(_make_pdf(["Soil carbon saturation", "Second page"]))
+
+    assert extract_text_from_pdf(pdf) == "Soil carbon saturation Second page"
+
+
+def test_unreadable_file_raises(tmp_path):
+    pdf = tmp_path / "broken.pdf"
+    pdf.write_bytes(b"not a pdf")
+
+    with pytest.raises(CorruptedPDFError):
+        extract_text_from_pdf(pdf)
+
+
+def test_cache_serves_renamed_file(tmp_path, counted_reads):
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"stub")
+    extract_text_from_pdf(pdf)
+
+    renamed = pdf.rename(tmp_path / "2024-renamed.pdf")
+    assert extract_text_from_pdf(renamed) == "x" * 100
+    assert len(counted_reads) == 1
+
+
+def test_truncated_read_only_serves_smaller_budgets(tmp_path, counted_reads):
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"stub")
+
+    extract_text_from_pdf(pdf, max_chars=50)
+    extract_text_from_pdf(pdf, max_chars=40)
+    assert len(counted_reads) == 1
+
+    extract_text_from_pdf(pdf)
+    assert counted_reads[-1] == ("paper.pdf", None)
+    assert len(counted_reads) == 2
+
+
+def test_prefetch_yields_every_pdf_in_order(tmp_path):
+    pdfs = []
+    for i in range(4):
+        pdf = tmp_path / f"paper{i}.pdf"
+        pdf.write_bytes(_make_pdf([f"Paper number {i}"]))
+        pdfs.append(pdf)
+
+    results = list(prefetch_pdf_text(pdfs, ahead=2))
+
+    assert [path for path, _ in results] == pdfs
+    assert [text for _, text in results] == [f"Paper number {i}" for i in range(4)]
+
+
+def test_prefetch_yields_none_for_failed_extraction(tmp_path):
+    good = tmp_path / "good.pdf"
+    good.write_bytes(_make_pdf(["Readable"]))
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+
+    assert list(prefetch_pdf_text([broken, good])) == [(broken, None), (good, "Readable")]